@@ -0,0 +1,10 @@
+"""
+Permite ejecutar el frontend con `python -m frontend` desde la raíz del proyecto.
+
+Con `-m`, el directorio actual (la raíz) ya encabeza sys.path, así que
+backend, frontend y utils se importan sin modificar rutas ni PYTHONPATH.
+"""
+
+from frontend.init import ejecutar_cli
+
+ejecutar_cli()
@@ -15,8 +15,13 @@ Versión: 2.0
 
 import os
 import sys
+import time
 import logging
-from typing import Optional
+import importlib.util
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional, Tuple
 
 # Configurar logging para el frontend
 logging.basicConfig(
@@ -26,6 +31,36 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Rutas base calculadas una sola vez al importar el módulo
+_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+_PROJECT_ROOT = os.path.dirname(_MODULE_DIR)
+
+# Iconos por estado para el reporte del sistema
+_STATUS_ICONS = {"ok": "✅", "warning": "⚠️", "error": "❌"}
+
+# Dependencias críticas verificadas por verificar_estado_sistema (módulo, descripción)
+_DEPENDENCIAS_CRITICAS: Tuple[Tuple[str, str], ...] = (
+    ('streamlit', 'Interfaz web'),
+    ('cv2', 'Procesamiento de video'),
+    ('tensorflow', 'Modelos de IA'),
+    ('plotly', 'Visualizaciones interactivas'),
+    ('pandas', 'Manejo de datos'),
+    ('numpy', 'Computación numérica')
+)
+
+# Dependencias críticas que importan los módulos de cada área: si falta alguna,
+# localizar el módulo no basta para darlo por disponible
+_DEPENDENCIAS_FRONTEND: Tuple[str, ...] = ('streamlit', 'plotly', 'pandas', 'numpy')
+_DEPENDENCIAS_BACKEND: Tuple[str, ...] = ('cv2', 'tensorflow', 'pandas', 'numpy')
+
+# Directorios del proyecto verificados por verificar_estado_sistema (nombre, descripción)
+_DIRECTORIOS_CRITICOS: Tuple[Tuple[str, str], ...] = (
+    ('models', 'Modelos de IA'),
+    ('resultados', 'Almacenamiento de resultados'),
+    ('backend', 'Lógica de procesamiento'),
+    ('frontend', 'Interfaz de usuario')
+)
+
 def iniciar_aplicacion():
     """
     Función principal para iniciar la aplicación de análisis emocional.
@@ -73,20 +108,10 @@ def _validar_entorno():
         'seaborn'
     ]
     
-    dependencias_faltantes = []
-    
-    for dep in dependencias_requeridas:
-        try:
-            # Mapeo especial para nombres de módulos
-            module_name = dep
-            if dep == 'opencv-python':
-                module_name = 'cv2'
-            elif dep == 'pillow':
-                module_name = 'PIL'
-                
-            __import__(module_name)
-        except ImportError:
-            dependencias_faltantes.append(dep)
+    # Las importaciones se solapan en hilos: el tiempo total se acerca al de la más lenta
+    with ThreadPoolExecutor(max_workers=len(dependencias_requeridas)) as executor:
+        resultados = executor.map(_intentar_importar, dependencias_requeridas)
+        dependencias_faltantes = [dep for dep in resultados if dep is not None]
     
     if dependencias_faltantes:
         logger.warning(f"⚠️ Dependencias faltantes: {dependencias_faltantes}")
@@ -94,37 +119,76 @@ def _validar_entorno():
     else:
         logger.info("✅ Todas las dependencias están instaladas")
 
+def _intentar_importar(dep: str) -> Optional[str]:
+    """
+    Intenta importar una dependencia.
+    
+    Args:
+        dep (str): Nombre del paquete tal como se instala con pip
+        
+    Returns:
+        Optional[str]: None si se importó, o el nombre del paquete si falta
+    """
+    # Mapeo especial para nombres de módulos
+    module_name = dep
+    if dep == 'opencv-python':
+        module_name = 'cv2'
+    elif dep == 'pillow':
+        module_name = 'PIL'
+    
+    try:
+        __import__(module_name)
+        return None
+    except ImportError:
+        return dep
+
 def _configurar_rutas():
     """Configura las rutas necesarias para el sistema."""
-    # Obtener directorio raíz del proyecto
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    project_root = os.path.dirname(current_dir)
-    
-    # Agregar rutas al sys.path si no están
+    # Agregar rutas al sys.path si no están (la raíz primero, para que resuelva antes)
     paths_to_add = [
-        project_root,
-        os.path.join(project_root, 'backend'),
-        os.path.join(project_root, 'frontend'),
-        os.path.join(project_root, 'frontend', 'components')
+        os.path.join(_PROJECT_ROOT, 'backend'),
+        os.path.join(_PROJECT_ROOT, 'frontend'),
+        os.path.join(_PROJECT_ROOT, 'frontend', 'components')
     ]
     
-    for path in paths_to_add:
-        if path not in sys.path:
-            sys.path.append(path)
+    existentes = set(sys.path)
+    if _PROJECT_ROOT not in existentes:
+        sys.path.insert(0, _PROJECT_ROOT)
+        existentes.add(_PROJECT_ROOT)
+    sys.path.extend(path for path in paths_to_add if path not in existentes)
     
     # Crear directorios necesarios
     directorios_necesarios = [
-        os.path.join(project_root, 'models'),
-        os.path.join(project_root, 'resultados'),
-        os.path.join(project_root, 'temp_uploaded_videos'),
-        os.path.join(project_root, 'logs')
+        os.path.join(_PROJECT_ROOT, 'models'),
+        os.path.join(_PROJECT_ROOT, 'resultados'),
+        os.path.join(_PROJECT_ROOT, 'temp_uploaded_videos'),
+        os.path.join(_PROJECT_ROOT, 'logs')
     ]
     
+    # Un único listado del directorio raíz en lugar de un stat por directorio
+    directorios_raiz = listar_directorio(_PROJECT_ROOT)
+
     for directorio in directorios_necesarios:
-        if not os.path.exists(directorio):
-            os.makedirs(directorio, exist_ok=True)
+        os.makedirs(directorio, exist_ok=True)
+        if os.path.basename(directorio) not in directorios_raiz:
             logger.info(f"📁 Directorio creado: {directorio}")
 
+def listar_directorio(path: str) -> set:
+    """
+    Obtiene los nombres de los subdirectorios de un directorio en una sola lectura.
+    
+    Args:
+        path (str): Directorio a listar
+        
+    Returns:
+        set: Nombres de los subdirectorios (vacío si el directorio no existe)
+    """
+    try:
+        with os.scandir(path) as entradas:
+            return {entrada.name for entrada in entradas if entrada.is_dir()}
+    except OSError:
+        return set()
+
 def _mostrar_ayuda_instalacion(dependencias_faltantes: Optional[list] = None):
     """
     Muestra ayuda para instalar dependencias faltantes.
@@ -154,13 +218,80 @@ def _mostrar_ayuda_instalacion(dependencias_faltantes: Optional[list] = None):
     print("\n📚 Documentación adicional disponible en el README.md")
     print("="*60 + "\n")
 
-def verificar_estado_sistema():
+def _modulo_disponible(nombre: str) -> bool:
+    """
+    Comprueba si un módulo es importable sin llegar a ejecutarlo.
+    
+    Args:
+        nombre (str): Nombre completo del módulo (p. ej. 'backend.pipeline')
+        
+    Returns:
+        bool: True si el módulo puede localizarse
+    """
+    try:
+        return importlib.util.find_spec(nombre) is not None
+    except (ImportError, ValueError):
+        return False
+
+def _verificar_modulos(info: dict, modulos: dict, dependencias: Tuple[str, ...], etiqueta: str):
+    """
+    Registra en `info` si cada módulo y sus dependencias críticas se localizan, sin importarlos.
+    
+    Args:
+        info (dict): Entrada del estado a completar
+        modulos (dict): Módulo -> descripción del componente
+        dependencias (Tuple[str, ...]): Dependencias críticas que importan esos módulos
+        etiqueta (str): Nombre del área para el mensaje de error
+    """
+    faltantes = [modulo for modulo in modulos if not _modulo_disponible(modulo)]
+    if faltantes:
+        info["status"] = "error"
+        info["detalles"].append(f"❌ Error {etiqueta}: módulos no encontrados {faltantes}")
+        return
+    dependencias_faltantes = [dep for dep in dependencias if not _modulo_disponible(dep)]
+    if dependencias_faltantes:
+        info["status"] = "error"
+        info["detalles"].append(f"❌ Error {etiqueta}: dependencias faltantes {dependencias_faltantes}")
+        return
+    for descripcion in modulos.values():
+        info["detalles"].append(f"✅ {descripcion} localizado")
+
+# Último estado calculado: (deep, instante, estado). Se reutiliza durante unos segundos
+_ESTADO_TTL_SEGUNDOS = 5
+_estado_cache = None
+
+def _invalidar_estado_cache():
+    """Descarta el estado cacheado (p. ej. tras crear directorios)."""
+    global _estado_cache
+    _estado_cache = None
+
+def verificar_estado_sistema(deep: bool = False):
     """
     Verifica el estado actual del sistema y sus componentes.
     
+    Por defecto solo localiza los módulos (find_spec) sin importarlos, lo que
+    evita cargar TensorFlow u OpenCV para un simple chequeo. Llamadas repetidas
+    dentro de _ESTADO_TTL_SEGUNDOS devuelven el resultado anterior.
+    
+    Args:
+        deep (bool): Si es True, importa realmente cada módulo (autotest completo)
+    
     Returns:
         dict: Estado de los componentes del sistema
     """
+    global _estado_cache
+    ahora = time.monotonic()
+    if _estado_cache is not None:
+        cache_deep, instante, estado = _estado_cache
+        if cache_deep == deep and ahora - instante < _ESTADO_TTL_SEGUNDOS:
+            return estado
+    
+    estado = _calcular_estado_sistema(deep)
+    _estado_cache = (deep, ahora, estado)
+    return estado
+
+def _calcular_estado_sistema(deep: bool) -> dict:
+    """Realiza las comprobaciones de verificar_estado_sistema sin cache."""
     estado = {
         "frontend": {"status": "ok", "detalles": []},
         "backend": {"status": "ok", "detalles": []},
@@ -169,62 +300,60 @@ def verificar_estado_sistema():
     }
     
     try:
-        # Verificar frontend
-        try:
-            from .interface import main
-            from .components.timeline_emotions import TimelineEmotions
-            estado["frontend"]["detalles"].append("✅ Interfaz principal disponible")
-            estado["frontend"]["detalles"].append("✅ Componente timeline disponible")
-        except ImportError as e:
-            estado["frontend"]["status"] = "error"
-            estado["frontend"]["detalles"].append(f"❌ Error frontend: {e}")
-        
-        # Verificar backend
-        try:
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            backend_path = os.path.join(os.path.dirname(current_dir), 'backend')
-            sys.path.append(backend_path)
-            
-            from backend.pipeline import PipelineAnalisisEmocional
-            from backend.detector_emociones import DetectorEmociones
-            from backend.analizador_audio import AudioAnalyzer
+        if not deep:
+            _verificar_modulos(estado["frontend"], {
+                'frontend.interface': 'Interfaz principal',
+                'frontend.components.timeline_emotions': 'Componente timeline'
+            }, _DEPENDENCIAS_FRONTEND, "frontend")
+            _verificar_modulos(estado["backend"], {
+                'backend.pipeline': 'Pipeline principal',
+                'backend.detector_emociones': 'Detector de emociones',
+                'backend.analizador_audio': 'Analizador de audio'
+            }, _DEPENDENCIAS_BACKEND, "backend")
+        else:
+            # Verificar frontend
+            try:
+                from .interface import main
+                from .components.timeline_emotions import TimelineEmotions
+                estado["frontend"]["detalles"].append("✅ Interfaz principal disponible")
+                estado["frontend"]["detalles"].append("✅ Componente timeline disponible")
+            except ImportError as e:
+                estado["frontend"]["status"] = "error"
+                estado["frontend"]["detalles"].append(f"❌ Error frontend: {e}")
             
-            estado["backend"]["detalles"].append("✅ Pipeline principal disponible")
-            estado["backend"]["detalles"].append("✅ Detector de emociones disponible")
-            estado["backend"]["detalles"].append("✅ Analizador de audio disponible")
-        except ImportError as e:
-            estado["backend"]["status"] = "error"  
-            estado["backend"]["detalles"].append(f"❌ Error backend: {e}")
+            # Verificar backend
+            try:
+                from backend.pipeline import PipelineAnalisisEmocional
+                from backend.detector_emociones import DetectorEmociones
+                from backend.analizador_audio import AudioAnalyzer
+                
+                estado["backend"]["detalles"].append("✅ Pipeline principal disponible")
+                estado["backend"]["detalles"].append("✅ Detector de emociones disponible")
+                estado["backend"]["detalles"].append("✅ Analizador de audio disponible")
+            except ImportError as e:
+                estado["backend"]["status"] = "error"  
+                estado["backend"]["detalles"].append(f"❌ Error backend: {e}")
         
         # Verificar dependencias críticas
-        dependencias_criticas = {
-            'streamlit': 'Interfaz web',
-            'cv2': 'Procesamiento de video', 
-            'tensorflow': 'Modelos de IA',
-            'plotly': 'Visualizaciones interactivas',
-            'pandas': 'Manejo de datos',
-            'numpy': 'Computación numérica'
-        }
-        
-        for dep, descripcion in dependencias_criticas.items():
-            try:
-                __import__(dep)
+        for dep, descripcion in _DEPENDENCIAS_CRITICAS:
+            if deep:
+                try:
+                    __import__(dep)
+                    disponible = True
+                except ImportError:
+                    disponible = False
+            else:
+                disponible = _modulo_disponible(dep)
+            
+            if disponible:
                 estado["dependencias"]["detalles"].append(f"✅ {descripcion} ({dep})")
-            except ImportError:
+            else:
                 estado["dependencias"]["status"] = "warning"
                 estado["dependencias"]["detalles"].append(f"⚠️ {descripcion} ({dep}) - No disponible")
         
         # Verificar directorios
-        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        directorios_criticos = {
-            'models': 'Modelos de IA',
-            'resultados': 'Almacenamiento de resultados',
-            'backend': 'Lógica de procesamiento',
-            'frontend': 'Interfaz de usuario'
-        }
-        
-        for dir_name, descripcion in directorios_criticos.items():
-            dir_path = os.path.join(project_root, dir_name)
+        for dir_name, descripcion in _DIRECTORIOS_CRITICOS:
+            dir_path = os.path.join(_PROJECT_ROOT, dir_name)
             if os.path.exists(dir_path):
                 estado["directorios"]["detalles"].append(f"✅ {descripcion} ({dir_name}/)")
             else:
@@ -237,61 +366,61 @@ def verificar_estado_sistema():
     
     return estado
 
-def generar_reporte_estado():
-    """Genera un reporte detallado del estado del sistema."""
-    print("\n" + "="*60)
-    print("🔍 REPORTE DE ESTADO DEL SISTEMA")
-    print("="*60)
+def generar_reporte_estado(deep: bool = False):
+    """
+    Genera un reporte detallado del estado del sistema.
     
-    estado = verificar_estado_sistema()
+    Args:
+        deep (bool): Importa realmente cada módulo en lugar de solo localizarlo
+    """
+    parts = ["", "="*60, "🔍 REPORTE DE ESTADO DEL SISTEMA", "="*60]
+    
+    estado = verificar_estado_sistema(deep=deep)
     
     # Mostrar estado de cada componente
     for componente, info in estado.items():
-        status_icon = {
-            "ok": "✅",
-            "warning": "⚠️", 
-            "error": "❌"
-        }.get(info["status"], "❓")
+        status_icon = _STATUS_ICONS.get(info["status"], "❓")
         
-        print(f"\n{status_icon} {componente.upper()}: {info['status'].upper()}")
-        for detalle in info["detalles"]:
-            print(f"   {detalle}")
+        parts.append(f"\n{status_icon} {componente.upper()}: {info['status'].upper()}")
+        parts.extend(f"   {detalle}" for detalle in info["detalles"])
     
-    # Resumen general
-    print(f"\n📊 RESUMEN:")
+    # Resumen general (conteo por estado en una sola pasada)
+    parts.append("\n📊 RESUMEN:")
     total_componentes = len(estado)
-    componentes_ok = sum(1 for info in estado.values() if info["status"] == "ok")
-    componentes_warning = sum(1 for info in estado.values() if info["status"] == "warning")
-    componentes_error = sum(1 for info in estado.values() if info["status"] == "error")
+    conteo = Counter(info["status"] for info in estado.values())
+    componentes_ok = conteo["ok"]
+    componentes_warning = conteo["warning"]
+    componentes_error = conteo["error"]
     
-    print(f"   • Componentes OK: {componentes_ok}/{total_componentes}")
+    parts.append(f"   • Componentes OK: {componentes_ok}/{total_componentes}")
     if componentes_warning > 0:
-        print(f"   • Componentes con advertencias: {componentes_warning}")
+        parts.append(f"   • Componentes con advertencias: {componentes_warning}")
     if componentes_error > 0:
-        print(f"   • Componentes con errores: {componentes_error}")
+        parts.append(f"   • Componentes con errores: {componentes_error}")
     
     # Recomendaciones
     if componentes_error > 0:
-        print(f"\n🚨 ACCIÓN REQUERIDA:")
-        print(f"   • Revisar errores críticos antes de ejecutar")
-        print(f"   • Ejecutar: pip install -r requirements.txt")
+        parts.append("\n🚨 ACCIÓN REQUERIDA:")
+        parts.append("   • Revisar errores críticos antes de ejecutar")
+        parts.append("   • Ejecutar: pip install -r requirements.txt")
     elif componentes_warning > 0:
-        print(f"\n💡 RECOMENDACIONES:")
-        print(f"   • Revisar advertencias para óptimo funcionamiento")
-        print(f"   • Crear directorios faltantes si es necesario")
+        parts.append("\n💡 RECOMENDACIONES:")
+        parts.append("   • Revisar advertencias para óptimo funcionamiento")
+        parts.append("   • Crear directorios faltantes si es necesario")
     else:
-        print(f"\n🎉 SISTEMA LISTO:")
-        print(f"   • Todos los componentes funcionan correctamente")
-        print(f"   • Ejecutar: streamlit run frontend/interface.py")
+        parts.append("\n🎉 SISTEMA LISTO:")
+        parts.append("   • Todos los componentes funcionan correctamente")
+        parts.append("   • Ejecutar: streamlit run frontend/interface.py")
     
-    print("="*60 + "\n")
+    parts.append("="*60 + "\n")
+    
+    # Una sola escritura en lugar de un print por línea
+    sys.stdout.write("\n".join(parts) + "\n")
     
     return estado
 
 def crear_estructura_proyecto():
     """Crea la estructura de directorios necesaria para el proyecto."""
-    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    
     estructura = {
         'models': 'Almacena los modelos de IA pre-entrenados',
         'resultados': 'Guarda resultados de análisis',
@@ -308,18 +437,27 @@ def crear_estructura_proyecto():
     directorios_creados = []
     directorios_existentes = []
     
+    # Clasificar con un listado por directorio padre en lugar de un stat por entrada
+    listados = {}
+    
     for directorio, descripcion in estructura.items():
-        dir_path = os.path.join(project_root, directorio)
+        dir_path = os.path.join(_PROJECT_ROOT, directorio)
         
-        if not os.path.exists(dir_path):
-            try:
-                os.makedirs(dir_path, exist_ok=True)
-                directorios_creados.append((directorio, descripcion))
-                print(f"   ✅ Creado: {directorio}/ - {descripcion}")
-            except Exception as e:
-                print(f"   ❌ Error creando {directorio}/: {e}")
-        else:
+        padre, _, nombre = directorio.rpartition('/')
+        if padre not in listados:
+            listados[padre] = listar_directorio(os.path.join(_PROJECT_ROOT, padre))
+        existia = nombre in listados[padre]
+        
+        if existia:
             directorios_existentes.append((directorio, descripcion))
+            continue
+        
+        try:
+            os.makedirs(dir_path, exist_ok=True)
+            directorios_creados.append((directorio, descripcion))
+            print(f"   ✅ Creado: {directorio}/ - {descripcion}")
+        except Exception as e:
+            print(f"   ❌ Error creando {directorio}/: {e}")
     
     print(f"\n📊 Resumen:")
     print(f"   • Directorios creados: {len(directorios_creados)}")
@@ -331,15 +469,16 @@ def crear_estructura_proyecto():
             print(f"   • {directorio}/ - {descripcion}")
     
     # Crear archivos de configuración básicos
-    _crear_archivos_config(project_root)
+    _crear_archivos_config(_PROJECT_ROOT)
+    
+    # La estructura cambió: el próximo chequeo debe recalcularse
+    _invalidar_estado_cache()
 
 def _crear_archivos_config(project_root: str):
     """Crea archivos de configuración básicos si no existen."""
     
     # .gitignore
-    gitignore_path = os.path.join(project_root, '.gitignore')
-    if not os.path.exists(gitignore_path):
-        gitignore_content = """# Archivos de Python
+    gitignore_content = """# Archivos de Python
 __pycache__/
 *.py[cod]
 *$py.class
@@ -388,18 +527,10 @@ models/*.pb
 *.swp
 *.swo
 """
-        
-        try:
-            with open(gitignore_path, 'w', encoding='utf-8') as f:
-                f.write(gitignore_content)
-            print(f"   ✅ Creado: .gitignore")
-        except Exception as e:
-            print(f"   ⚠️ Error creando .gitignore: {e}")
+    _escribir_archivo_config(os.path.join(project_root, '.gitignore'), gitignore_content)
     
     # README básico si no existe
-    readme_path = os.path.join(project_root, 'README.md')
-    if not os.path.exists(readme_path):
-        readme_content = """# Sistema de Análisis Emocional Multimodal
+    readme_content = """# Sistema de Análisis Emocional Multimodal
 
 Sistema avanzado para análisis de emociones y comunicación en niños con discapacidad.
 
@@ -431,34 +562,52 @@ streamlit run frontend/interface.py
 - ✅ Interfaz web profesional y responsive
 
 """
-        
-        try:
-            with open(readme_path, 'w', encoding='utf-8') as f:
-                f.write(readme_content)
-            print(f"   ✅ Creado: README.md")
-        except Exception as e:
-            print(f"   ⚠️ Error creando README.md: {e}")
+    _escribir_archivo_config(os.path.join(project_root, 'README.md'), readme_content)
+
+def _escribir_archivo_config(path: str, contenido: str):
+    """
+    Escribe un archivo de configuración solo si aún no existe.
+    
+    Args:
+        path (str): Ruta del archivo
+        contenido (str): Contenido a escribir
+    """
+    archivo = Path(path)
+    if archivo.exists():
+        return  # No se sobrescriben archivos ya presentes (pueden tener cambios del usuario)
+    
+    try:
+        archivo.write_text(contenido, encoding='utf-8')
+        print(f"   ✅ Creado: {archivo.name}")
+    except Exception as e:
+        print(f"   ⚠️ Error creando {archivo.name}: {e}")
 
 # Función principal de compatibilidad (mantiene nombre original)
 def main_interface():
     """Función de compatibilidad que ejecuta la interfaz principal."""
     iniciar_aplicacion()
 
-# Ejecutar si se llama directamente
-if __name__ == "__main__":
+def ejecutar_cli(argv: Optional[list] = None):
+    """
+    Punto de entrada de línea de comandos (--setup, --check, --run).
+    
+    Args:
+        argv (list): Argumentos a interpretar (por defecto sys.argv)
+    """
     import argparse
     
     parser = argparse.ArgumentParser(description="Sistema de Análisis Emocional Multimodal")
     parser.add_argument("--setup", action="store_true", help="Crear estructura de proyecto")
     parser.add_argument("--check", action="store_true", help="Verificar estado del sistema")
     parser.add_argument("--run", action="store_true", help="Ejecutar aplicación")
+    parser.add_argument("--deep", action="store_true", help="Con --check, importar cada módulo (autotest completo)")
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     if args.setup:
         crear_estructura_proyecto()
     elif args.check:
-        generar_reporte_estado()
+        generar_reporte_estado(deep=args.deep)
     elif args.run:
         iniciar_aplicacion()
     else:
@@ -469,5 +618,10 @@ if __name__ == "__main__":
         print("  --setup    Crear estructura de directorios")
         print("  --check    Verificar estado del sistema")
         print("  --run      Ejecutar la aplicación")
+        print("  --deep     Junto a --check, importa cada módulo")
         print()
         print("Ejemplo: python -m frontend --run")
+
+# Ejecutar si se llama directamente
+if __name__ == "__main__":
+    ejecutar_cli()
@@ -1,11 +1,17 @@
 import os
 import sys
+import tempfile
+import uuid
 import streamlit as st
+import numpy as np
 import pandas as pd
 import json
+import html
+import hashlib
 import base64
 from datetime import datetime
-from typing import Dict, Optional, List
+from functools import lru_cache
+from typing import Dict, Optional, List, Tuple
 
 # Configuración de página DEBE ser lo primero
 st.set_page_config(
@@ -15,187 +21,223 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Añadir carpeta raíz del proyecto para importar backend
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+# Añadir carpeta raíz del proyecto para importar backend (una sola vez: el
+# script se re-ejecuta en cada interacción de Streamlit)
+_PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if _PROJECT_ROOT not in sys.path:
+    sys.path.append(_PROJECT_ROOT)
 
 try:
     from backend.pipeline import PipelineAnalisisEmocional
     from frontend.components.timeline_emotions import TimelineEmotions
+    from utils.validacion import validar_video
 except ImportError as e:
     st.error(f"Error importando módulos: {e}")
     st.stop()
 
-# CSS personalizado para diseño profesional
-def load_custom_css():
-    st.markdown("""
-    <style>
-    /* Importar fuente profesional */
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap');
-
-    /* Estilos globales */
-    :root {
-        --primary-color: #2e7d8b; /* Teal oscuro */
-        --secondary-color: #4a9dba; /* Teal claro */
-        --background-color: #f0f2f6; /* Fondo suave */
-        --text-color: #1c1e21; /* Texto oscuro */
-        --border-color: #cfd8dc; /* Borde gris */
-        --shadow-color: rgba(0, 0, 0, 0.05);
-    }
-    html, body, .main, .stApp {
-        font-family: 'Inter', sans-serif;
-        color: var(--text-color);
-        background-color: var(--background-color);
-    }
-
-    /* Header principal */
-    .main-header {
-        text-align: center;
-        padding: 1.5rem 0;
-        margin-bottom: 2rem;
-        border-bottom: 1px solid var(--border-color);
-    }
+# Directorio donde se guardan temporalmente los videos subidos
+TEMP_UPLOAD_DIR = "./temp_uploaded_videos"
+
+# Tamaño de bloque al copiar el video subido a disco
+UPLOAD_CHUNK_BYTES = 1024 * 1024
+
+# Bytes del reporte TXT mostrados como vista previa
+REPORT_PREVIEW_BYTES = 8 * 1024
+
+# CSS personalizado para diseño profesional (constante: no se reconstruye en cada rerun)
+_CUSTOM_CSS = """
+<style>
+/* Importar fuente profesional */
+@import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap');
+
+/* Estilos globales */
+:root {
+    --primary-color: #2e7d8b; /* Teal oscuro */
+    --secondary-color: #4a9dba; /* Teal claro */
+    --background-color: #f0f2f6; /* Fondo suave */
+    --text-color: #1c1e21; /* Texto oscuro */
+    --border-color: #cfd8dc; /* Borde gris */
+    --shadow-color: rgba(0, 0, 0, 0.05);
+}
+html, body, .main, .stApp {
+    font-family: 'Inter', sans-serif;
+    color: var(--text-color);
+    background-color: var(--background-color);
+}
+
+/* Header principal */
+.main-header {
+    text-align: center;
+    padding: 1.5rem 0;
+    margin-bottom: 2rem;
+    border-bottom: 1px solid var(--border-color);
+}
+.main-header h1 {
+    color: var(--primary-color);
+    font-weight: 700;
+    font-size: 2.5rem;
+    margin-bottom: 0.25rem;
+}
+.main-header p {
+    color: #607d8b;
+    font-size: 1.1rem;
+}
+
+/* Cards profesionales */
+.professional-card {
+    background-color: #ffffff;
+    border-radius: 12px;
+    padding: 1.5rem;
+    box-shadow: 0 4px 12px var(--shadow-color);
+    margin-bottom: 1.5rem;
+    border-left: 5px solid var(--primary-color);
+    transition: transform 0.2s;
+}
+.professional-card:hover {
+    transform: translateY(-2px);
+}
+.card-header {
+    display: flex;
+    align-items: center;
+    margin-bottom: 1rem;
+}
+.card-icon {
+    font-size: 1.5rem;
+    margin-right: 0.75rem;
+    color: var(--primary-color);
+}
+.card-title {
+    font-size: 1.25rem;
+    font-weight: 600;
+    margin: 0;
+}
+
+/* Filas de cards (pantalla de ayuda) */
+.card-row {
+    display: flex;
+    gap: 1rem;
+    margin-bottom: 1rem;
+}
+.card-row > div {
+    flex: 1;
+}
+.info-panel {
+    background-color: rgba(28, 131, 225, 0.1);
+    color: #004280;
+    border-radius: 8px;
+    padding: 1rem;
+}
+
+/* Cards de métricas */
+.metric-container {
+    display: flex;
+    gap: 1rem;
+    margin-bottom: 1.5rem;
+}
+.metric-card {
+    background-color: #ffffff;
+    border-radius: 8px;
+    padding: 1rem;
+    box-shadow: 0 2px 6px var(--shadow-color);
+    flex: 1;
+    text-align: center;
+}
+.metric-value {
+    font-size: 1.8rem;
+    font-weight: 700;
+    color: var(--primary-color);
+    margin-bottom: 0.25rem;
+}
+.metric-label {
+    font-size: 0.9rem;
+    color: #607d8b;
+    font-weight: 500;
+}
+
+/* Alertas personalizadas */
+.alert-critical {
+    background-color: #ffebee;
+    color: #c62828;
+    border: 1px solid #e57373;
+    border-radius: 8px;
+    padding: 1rem;
+    margin-bottom: 1rem;
+}
+.alert-warning {
+    background-color: #fffde7;
+    color: #ffb300;
+    border: 1px solid #fff176;
+    border-radius: 8px;
+    padding: 1rem;
+    margin-bottom: 1rem;
+}
+.alert-success {
+    background-color: #e8f5e9;
+    color: #2e7d32;
+    border: 1px solid #81c784;
+    border-radius: 8px;
+    padding: 1rem;
+    margin-bottom: 1rem;
+}
+
+/* Progress bar personalizada */
+.stProgress > div > div > div > div {
+    background: linear-gradient(135deg, var(--primary-color), var(--secondary-color));
+}
+
+/* Selectbox y inputs */
+.stSelectbox > div > div > select,
+.stTextInput > div > div > input {
+    border-radius: 8px;
+    border: 2px solid var(--border-color);
+    padding: 0.75rem;
+    font-size: 1rem;
+}
+
+.stSelectbox > div > div > select:focus,
+.stTextInput > div > div > input:focus {
+    border-color: var(--primary-color);
+    box-shadow: 0 0 0 2px rgba(46, 125, 139, 0.1);
+}
+
+/* File uploader */
+.stFileUploader > div {
+    border: 2px dashed var(--primary-color);
+    border-radius: 12px;
+    padding: 2rem;
+    background: linear-gradient(135deg, rgba(46, 125, 139, 0.05), rgba(74, 157, 186, 0.05));
+}
+
+/* Ocultar elementos de Streamlit */
+#MainMenu {visibility: hidden;}
+footer {visibility: hidden;}
+.stDeployButton {display: none;}
+
+/* Responsive */
+@media (max-width: 768px) {
     .main-header h1 {
-        color: var(--primary-color);
-        font-weight: 700;
-        font-size: 2.5rem;
-        margin-bottom: 0.25rem;
-    }
-    .main-header p {
-        color: #607d8b;
-        font-size: 1.1rem;
+        font-size: 2rem;
     }
 
-    /* Cards profesionales */
-    .professional-card {
-        background-color: #ffffff;
-        border-radius: 12px;
-        padding: 1.5rem;
-        box-shadow: 0 4px 12px var(--shadow-color);
-        margin-bottom: 1.5rem;
-        border-left: 5px solid var(--primary-color);
-        transition: transform 0.2s;
-    }
-    .professional-card:hover {
-        transform: translateY(-2px);
-    }
-    .card-header {
-        display: flex;
-        align-items: center;
-        margin-bottom: 1rem;
-    }
-    .card-icon {
-        font-size: 1.5rem;
-        margin-right: 0.75rem;
-        color: var(--primary-color);
-    }
-    .card-title {
-        font-size: 1.25rem;
-        font-weight: 600;
-        margin: 0;
-    }
-
-    /* Cards de métricas */
     .metric-container {
-        display: flex;
-        gap: 1rem;
-        margin-bottom: 1.5rem;
-    }
-    .metric-card {
-        background-color: #ffffff;
-        border-radius: 8px;
-        padding: 1rem;
-        box-shadow: 0 2px 6px var(--shadow-color);
-        flex: 1;
-        text-align: center;
-    }
-    .metric-value {
-        font-size: 1.8rem;
-        font-weight: 700;
-        color: var(--primary-color);
-        margin-bottom: 0.25rem;
-    }
-    .metric-label {
-        font-size: 0.9rem;
-        color: #607d8b;
-        font-weight: 500;
-    }
-
-    /* Alertas personalizadas */
-    .alert-critical {
-        background-color: #ffebee;
-        color: #c62828;
-        border: 1px solid #e57373;
-        border-radius: 8px;
-        padding: 1rem;
-        margin-bottom: 1rem;
-    }
-    .alert-warning {
-        background-color: #fffde7;
-        color: #ffb300;
-        border: 1px solid #fff176;
-        border-radius: 8px;
-        padding: 1rem;
-        margin-bottom: 1rem;
-    }
-    .alert-success {
-        background-color: #e8f5e9;
-        color: #2e7d32;
-        border: 1px solid #81c784;
-        border-radius: 8px;
-        padding: 1rem;
-        margin-bottom: 1rem;
-    }
-
-    /* Progress bar personalizada */
-    .stProgress > div > div > div > div {
-        background: linear-gradient(135deg, var(--primary-color), var(--secondary-color));
-    }
-
-    /* Selectbox y inputs */
-    .stSelectbox > div > div > select,
-    .stTextInput > div > div > input {
-        border-radius: 8px;
-        border: 2px solid var(--border-color);
-        padding: 0.75rem;
-        font-size: 1rem;
+        flex-direction: column;
+        align-items: center;
     }
 
-    .stSelectbox > div > div > select:focus,
-    .stTextInput > div > div > input:focus {
-        border-color: var(--primary-color);
-        box-shadow: 0 0 0 2px rgba(46, 125, 139, 0.1);
+    .card-row {
+        flex-direction: column;
     }
 
-    /* File uploader */
-    .stFileUploader > div {
-        border: 2px dashed var(--primary-color);
-        border-radius: 12px;
-        padding: 2rem;
-        background: linear-gradient(135deg, rgba(46, 125, 139, 0.05), rgba(74, 157, 186, 0.05));
+    .professional-card {
+        margin: 0.5rem 0;
     }
+}
+</style>
+"""
 
-    /* Ocultar elementos de Streamlit */
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
-    .stDeployButton {display: none;}
-
-    /* Responsive */
-    @media (max-width: 768px) {
-        .main-header h1 {
-            font-size: 2rem;
-        }
-
-        .metric-container {
-            flex-direction: column;
-            align-items: center;
-        }
-
-        .professional-card {
-            margin: 0.5rem 0;
-        }
-    }
-    </style>
-    """, unsafe_allow_html=True)
+def load_custom_css():
+    """Inyecta el CSS personalizado de la aplicación."""
+    st.markdown(_CUSTOM_CSS, unsafe_allow_html=True)
 
 def initialize_session_state():
     """Inicializa el estado de la sesión con valores por defecto."""
@@ -207,6 +249,55 @@ def initialize_session_state():
         st.session_state.session_history = []
     if 'pipeline' not in st.session_state:
         st.session_state.pipeline = None
+    if 'temp_video_path' not in st.session_state:
+        st.session_state.temp_video_path = None
+
+@st.cache_data(show_spinner=False, max_entries=8, ttl=3600)
+def _run_pipeline(digest: str, models_dir: str, lang: str, datos_personales: Dict,
+                  configuracion: Dict, _video_path: str,
+                  _pipeline: PipelineAnalisisEmocional) -> Dict:
+    """
+    Ejecuta el pipeline y cachea el resultado en memoria.
+    
+    La clave es el hash SHA-256 del video más los parámetros del análisis;
+    `_video_path` y `_pipeline` no forman parte de ella. Los análisis
+    fallidos lanzan una excepción para que no queden cacheados.
+    
+    El cache sólo vive en memoria y está acotado (8 entradas, 1 hora): los
+    resultados contienen datos sensibles del participante y no se escriben
+    en disco. Un acierto devuelve el análisis original, con su `session_id`
+    y las rutas de los archivos que generó entonces.
+    
+    Args:
+        digest (str): SHA-256 del contenido del video
+        models_dir (str): Directorio de modelos
+        lang (str): Idioma del audio
+        datos_personales (Dict): Datos del participante
+        configuracion (Dict): Configuración personalizada del análisis
+        _video_path (str): Ruta del video temporal a analizar
+        _pipeline (PipelineAnalisisEmocional): Pipeline de la sesión que ejecuta el análisis
+        
+    Returns:
+        Dict: Resultados del pipeline
+    """
+    resultados = _pipeline.ejecutar_pipeline(
+        video_path=_video_path,
+        lang=lang,
+        datos_personales=datos_personales,
+        configuracion_personalizada=configuracion
+    )
+    if resultados.get('error'):
+        raise RuntimeError(resultados['error'])
+    # Momento real del análisis: permite reconocer un resultado reutilizado
+    resultados['generado_en'] = datetime.now()
+    return resultados
+
+def _limpiar_video_temporal():
+    """Elimina el video temporal de la sesión, si existe."""
+    temp_path = st.session_state.temp_video_path
+    if temp_path and os.path.exists(temp_path):
+        os.remove(temp_path)
+    st.session_state.temp_video_path = None
 
 def render_header():
     """Renderiza el header principal de la aplicación."""
@@ -217,97 +308,80 @@ def render_header():
     </div>
     """, unsafe_allow_html=True)
 
-def render_sidebar():
-    """Renderiza la barra lateral con configuraciones y formulario de datos."""
-    st.sidebar.markdown("### ⚙️ Configuración del Análisis")
-
-    # Sección de upload de video
-    st.sidebar.markdown("#### 📹 Video a Analizar")
-    video_file = st.sidebar.file_uploader(
-        "Selecciona un video",
-        type=["mp4", "avi", "mov", "mkv"],
-        help="Formatos soportados: MP4, AVI, MOV, MKV"
-    )
-
-    # Configuraciones técnicas
-    st.sidebar.markdown("#### 🔧 Configuraciones Técnicas")
-
-    col1, col2 = st.sidebar.columns(2)
-    with col1:
-        models_dir = st.text_input(
-            "Directorio de modelos",
-            value="./models",
-            help="Ruta donde se encuentran los modelos de IA"
-        )
-
-    with col2:
-        language = st.selectbox(
-            "Idioma del audio",
-            options=["es-ES", "en-US", "es-MX", "es-AR"],
-            help="Idioma para el reconocimiento de voz"
-        )
+# Opciones fijas de los widgets de la barra lateral
+_TIPOS_VIDEO = ("mp4", "avi", "mov", "mkv")
+_IDIOMAS_AUDIO = ("es-ES", "en-US", "es-MX", "es-AR")
+_DIAGNOSTICOS = (
+    "",
+    "Autismo/TEA",
+    "TDAH",
+    "Síndrome de Down",
+    "Parálisis Cerebral",
+    "Discapacidad Intelectual",
+    "Trastornos del Lenguaje",
+    "Otro"
+)
+_ROLES_USUARIO = ("Padre/Madre", "Educador", "Terapeuta", "Investigador", "Otro")
 
-    # Configuraciones avanzadas
-    with st.sidebar.expander("⚡ Configuraciones Avanzadas"):
-        intervalo_analisis = st.slider(
+@st.fragment
+def _render_configuracion_avanzada():
+    """Renderiza el expander de configuraciones avanzadas como fragmento independiente."""
+    with st.expander("⚡ Configuraciones Avanzadas"):
+        st.slider(
             "Intervalo de análisis (ms)",
             min_value=500,
             max_value=5000,
             value=1000,
             step=250,
-            help="Frecuencia de análisis de frames"
+            help="Frecuencia de análisis de frames",
+            key="config_intervalo_analisis"
         )
 
-        umbral_confianza = st.slider(
+        st.slider(
             "Umbral de confianza",
             min_value=0.1,
             max_value=0.9,
             value=0.5,
             step=0.1,
-            help="Confianza mínima para detectar emociones"
+            help="Confianza mínima para detectar emociones",
+            key="config_umbral_confianza"
         )
 
-        guardar_frames = st.checkbox(
+        st.checkbox(
             "Guardar fotogramas detectados",
             value=True,
-            help="Guarda imágenes de rostros detectados"
+            help="Guarda imágenes de rostros detectados",
+            key="config_guardar_frames"
         )
 
-    # Información personal del niño
-    st.sidebar.markdown("#### 👶 Información del Participante")
-
-    with st.sidebar.form("datos_personales"):
+@st.fragment
+def _render_datos_personales():
+    """Renderiza el formulario de datos del participante como fragmento independiente."""
+    with st.form("datos_personales"):
         st.markdown("**Datos del Niño:**")
-        nombre = st.text_input("Nombre", placeholder="Nombre del niño")
-        edad = st.number_input("Edad", min_value=1, max_value=18, value=5)
+        nombre = st.text_input("Nombre", placeholder="Nombre del niño", key="participante_nombre")
+        st.number_input("Edad", min_value=1, max_value=18, value=5, key="participante_edad")
         diagnostico = st.selectbox(
             "Diagnóstico",
-            options=[
-                "",
-                "Autismo/TEA",
-                "TDAH",
-                "Síndrome de Down",
-                "Parálisis Cerebral",
-                "Discapacidad Intelectual",
-                "Trastornos del Lenguaje",
-                "Otro"
-            ]
+            options=_DIAGNOSTICOS,
+            key="participante_diagnostico"
         )
 
         if diagnostico == "Otro":
-            diagnostico_otro = st.text_input("Especificar diagnóstico")
-            diagnostico = diagnostico_otro if diagnostico_otro else "No especificado"
+            st.text_input("Especificar diagnóstico", key="participante_diagnostico_otro")
 
         st.markdown("**Información del Usuario:**")
-        rol_usuario = st.selectbox(
+        st.selectbox(
             "Tu rol",
-            options=["Padre/Madre", "Educador", "Terapeuta", "Investigador", "Otro"]
+            options=_ROLES_USUARIO,
+            key="participante_rol"
         )
 
-        contexto_video = st.text_area(
+        st.text_area(
             "Contexto del video",
             placeholder="Describe la situación en la que se grabó el video...",
-            height=100
+            height=100,
+            key="participante_contexto"
         )
 
         submit_info = st.form_submit_button("💾 Guardar Información")
@@ -315,44 +389,77 @@ def render_sidebar():
         if submit_info and nombre:
             st.success("✅ Información guardada correctamente")
 
-    # Datos personales para retornar
-    datos_personales = {}
-    if 'nombre' in locals():
-        datos_personales = {
-            "nombre": nombre if nombre else "",
-            "edad": edad,
-            "diagnostico": diagnostico if diagnostico else "",
-            "rol_usuario": rol_usuario,
-            "contexto_video": contexto_video
-        }
-    else:
-        # Valores por defecto si no se ha renderizado el formulario
-        datos_personales = {
-            "nombre": "",
-            "edad": 5,
-            "diagnostico": "",
-            "rol_usuario": "Padre/Madre",
-            "contexto_video": ""
-        }
+def render_sidebar():
+    """Renderiza la barra lateral con configuraciones y formulario de datos."""
+    st.sidebar.markdown("### ⚙️ Configuración del Análisis")
+
+    # Sección de upload de video
+    st.sidebar.markdown("#### 📹 Video a Analizar")
+    video_file = st.sidebar.file_uploader(
+        "Selecciona un video",
+        type=_TIPOS_VIDEO,
+        help="Formatos soportados: MP4, AVI, MOV, MKV"
+    )
+
+    # Configuraciones técnicas
+    st.sidebar.markdown("#### 🔧 Configuraciones Técnicas")
+
+    col1, col2 = st.sidebar.columns(2)
+    with col1:
+        models_dir = st.text_input(
+            "Directorio de modelos",
+            value="./models",
+            help="Ruta donde se encuentran los modelos de IA"
+        )
+
+    with col2:
+        language = st.selectbox(
+            "Idioma del audio",
+            options=_IDIOMAS_AUDIO,
+            help="Idioma para el reconocimiento de voz"
+        )
+
+    # Configuraciones avanzadas (fragmento: mover un slider no re-ejecuta todo el script)
+    with st.sidebar:
+        _render_configuracion_avanzada()
+
+    # Información personal del niño
+    st.sidebar.markdown("#### 👶 Información del Participante")
+
+    with st.sidebar:
+        _render_datos_personales()
+
+    # Datos personales para retornar (los widgets de los fragmentos guardan su valor en session_state)
+    diagnostico = st.session_state.get("participante_diagnostico", "")
+    if diagnostico == "Otro":
+        diagnostico = st.session_state.get("participante_diagnostico_otro") or "No especificado"
+
+    datos_personales = {
+        "nombre": st.session_state.get("participante_nombre", ""),
+        "edad": st.session_state.get("participante_edad", 5),
+        "diagnostico": diagnostico,
+        "rol_usuario": st.session_state.get("participante_rol", "Padre/Madre"),
+        "contexto_video": st.session_state.get("participante_contexto", "")
+    }
 
     # Configuraciones personalizadas para retornar
-    configuracion_personalizada = {}
-    if 'intervalo_analisis' in locals():
-        configuracion_personalizada = {
-            "intervalo_analisis_ms": intervalo_analisis,
-            "umbral_confianza": umbral_confianza,
-            "guardar_frames": guardar_frames
-        }
-    else:
-        # Valores por defecto si no se ha renderizado el expander
-        configuracion_personalizada = {
-            "intervalo_analisis_ms": 1000,
-            "umbral_confianza": 0.5,
-            "guardar_frames": True
-        }
+    configuracion_personalizada = {
+        "intervalo_analisis_ms": st.session_state.get("config_intervalo_analisis", 1000),
+        "umbral_confianza": st.session_state.get("config_umbral_confianza", 0.5),
+        "guardar_frames": st.session_state.get("config_guardar_frames", True)
+    }
 
     return video_file, models_dir, language, datos_personales, configuracion_personalizada
 
+# Plantillas HTML de las tarjetas de métricas (sin líneas en blanco: van en un solo bloque)
+_METRIC_CARD_TMPL = (
+    '<div class="metric-card">'
+    '<div class="metric-value">{valor}</div>'
+    '<div class="metric-label">{etiqueta}</div>'
+    '</div>'
+)
+_METRIC_ROW_TMPL = '<div class="metric-container">{tarjetas}</div>'
+
 def display_metrics_dashboard(results: Dict):
     """Muestra dashboard con métricas principales."""
     if not results or not results.get('session_info'):
@@ -365,48 +472,59 @@ def display_metrics_dashboard(results: Dict):
     emociones = results.get('emociones', [])
     audio_info = results.get('audio', {})
 
-    # Calcular métricas
-    total_frames = len(emociones)
-    total_rostros = sum(len(frame.get('emociones', [])) for frame in emociones)
-    tiempo_procesamiento = session_info.get('tiempo_procesamiento', 'N/A')
+    # Calcular métricas (totales tomados de las tablas cacheadas del análisis)
+    _, _, _, total_rostros, total_frames = _tablas_emociones(_run_id(results), emociones)
+    palabras = audio_info.get('palabras_totales', 0)
     alertas_count = len(session_info.get('alertas', []))
 
-    # Mostrar métricas en cards
-    col1, col2, col3, col4 = st.columns(4)
-
-    with col1:
-        st.markdown(f"""
-        <div class="metric-card">
-            <div class="metric-value">{total_frames}</div>
-            <div class="metric-label">Frames Analizados</div>
-        </div>
-        """, unsafe_allow_html=True)
-
-    with col2:
-        st.markdown(f"""
-        <div class="metric-card">
-            <div class="metric-value">{total_rostros}</div>
-            <div class="metric-label">Rostros Detectados</div>
-        </div>
-        """, unsafe_allow_html=True)
-
-    with col3:
-        palabras = audio_info.get('palabras_totales', 0)
-        st.markdown(f"""
-        <div class="metric-card">
-            <div class="metric-value">{palabras}</div>
-            <div class="metric-label">Palabras Detectadas</div>
-        </div>
-        """, unsafe_allow_html=True)
-
-    with col4:
-        color_class = "metric-card" if alertas_count == 0 else "metric-card alert-critical-bg" # Se usaría una clase de fondo
-        st.markdown(f"""
-        <div class="metric-card">
-            <div class="metric-value">{alertas_count}</div>
-            <div class="metric-label">Alertas</div>
-        </div>
-        """, unsafe_allow_html=True)
+    # Mostrar métricas en cards (una sola fila flex en un único elemento)
+    tarjetas = "".join(
+        _METRIC_CARD_TMPL.format(valor=valor, etiqueta=etiqueta)
+        for valor, etiqueta in (
+            (total_frames, "Frames Analizados"),
+            (total_rostros, "Rostros Detectados"),
+            (palabras, "Palabras Detectadas"),
+            (alertas_count, "Alertas")
+        )
+    )
+    st.markdown(_METRIC_ROW_TMPL.format(tarjetas=tarjetas), unsafe_allow_html=True)
+
+# Plantillas HTML de alertas y valores por defecto de sus campos
+_ALERTA_CRITICA_TMPL = """
+<div class="alert-critical">
+    <h4>🚨 {mensaje}</h4>
+    <p><strong>Recomendación:</strong> {recomendacion}</p>
+    <small>Tipo: {tipo} | Detectado: {timestamp}</small>
+</div>
+"""
+
+_ALERTA_MODERADA_TMPL = """
+<div class="alert-warning">
+    <h4>⚡ {mensaje}</h4>
+    <p><strong>Recomendación:</strong> {recomendacion}</p>
+    <small>Tipo: {tipo}</small>
+</div>
+"""
+
+_ALERTA_CRITICA_DEFECTOS = {
+    'mensaje': 'Alerta crítica',
+    'recomendacion': 'Consultar especialista',
+    'tipo': 'General',
+    'timestamp': ''
+}
+
+_ALERTA_MODERADA_DEFECTOS = {
+    'mensaje': 'Alerta moderada',
+    'recomendacion': 'Monitoreo recomendado',
+    'tipo': 'General'
+}
+
+def _render_alerta(plantilla: str, alerta: Dict, defectos: Dict[str, str]) -> str:
+    """Rellena una plantilla de alerta escapando cada campo para HTML."""
+    return plantilla.format_map({
+        campo: html.escape(str(alerta.get(campo, defecto)))
+        for campo, defecto in defectos.items()
+    })
 
 def display_alerts(session_info: Dict):
     """Muestra alertas del análisis."""
@@ -428,27 +546,113 @@ def display_alerts(session_info: Dict):
     alertas_moderadas = [a for a in alertas if a.get('nivel') == 'medio']
     alertas_info = [a for a in alertas if a.get('nivel') == 'bajo']
 
-    # Mostrar alertas críticas
-    for alerta in alertas_criticas:
-        st.markdown(f"""
-        <div class="alert-critical">
-            <h4>🚨 {alerta.get('mensaje', 'Alerta crítica')}</h4>
-            <p><strong>Recomendación:</strong> {alerta.get('recomendacion', 'Consultar especialista')}</p>
-            <small>Tipo: {alerta.get('tipo', 'General')} | Detectado: {alerta.get('timestamp', '')}</small>
-        </div>
-        """, unsafe_allow_html=True)
-
-    # Mostrar alertas moderadas
-    for alerta in alertas_moderadas:
-        st.markdown(f"""
-        <div class="alert-warning">
-            <h4>⚡ {alerta.get('mensaje', 'Alerta moderada')}</h4>
-            <p><strong>Recomendación:</strong> {alerta.get('recomendacion', 'Monitoreo recomendado')}</p>
-            <small>Tipo: {alerta.get('tipo', 'General')}</small>
-        </div>
-        """, unsafe_allow_html=True)
-
-def display_emotions_analysis(emociones: List[Dict]):
+    # Mostrar alertas críticas (un solo bloque HTML para todas)
+    if alertas_criticas:
+        st.markdown("\n".join(
+            _render_alerta(_ALERTA_CRITICA_TMPL, alerta, _ALERTA_CRITICA_DEFECTOS)
+            for alerta in alertas_criticas
+        ), unsafe_allow_html=True)
+
+    # Mostrar alertas moderadas (un solo bloque HTML para todas)
+    if alertas_moderadas:
+        st.markdown("\n".join(
+            _render_alerta(_ALERTA_MODERADA_TMPL, alerta, _ALERTA_MODERADA_DEFECTOS)
+            for alerta in alertas_moderadas
+        ), unsafe_allow_html=True)
+
+# Columnas de la tabla detallada de emociones (columna del DataFrame -> encabezado)
+_COLUMNAS_TABLA_EMOCIONES = {
+    'frame_id': "Frame",
+    'tiempo_video': "Tiempo (s)",
+    'rostro': "Rostro",
+    'emotion': "Emoción",
+    'confidence': "Confianza",
+    'quality_score': "Calidad"
+}
+
+# Formato de visualización de las columnas numéricas de la tabla
+_FORMATO_TABLA_EMOCIONES = {
+    "Tiempo (s)": '{:.2f}',
+    "Confianza": '{:.3f}',
+    "Calidad": '{:.3f}'
+}
+
+def _emotions_to_df(emociones: List[Dict]) -> pd.DataFrame:
+    """Normaliza las detecciones (una fila por rostro) en un DataFrame."""
+    frames = [frame for frame in emociones if frame.get('emociones')]
+    if not frames:
+        return pd.DataFrame(columns=list(_COLUMNAS_TABLA_EMOCIONES))
+
+    # Cada detección ya trae su propio frame_id: el prefijo evita el choque de nombres
+    detecciones = pd.json_normalize(
+        frames,
+        record_path='emociones',
+        meta=['frame_id', 'tiempo_video'],
+        meta_prefix='frame.',
+        errors='ignore'
+    )
+    df = detecciones.reindex(columns=[
+        'frame.frame_id', 'frame.tiempo_video', 'emotion', 'confidence', 'quality_score'
+    ])
+    df.columns = ['frame_id', 'tiempo_video', 'emotion', 'confidence', 'quality_score']
+    # Las columnas meta llegan como object: inferir tipos antes de rellenar
+    # (fillna sobre object con downcast está obsoleto en pandas 2.x)
+    df = df.infer_objects().fillna({
+        'frame_id': 0,
+        'tiempo_video': 0.0,
+        'emotion': 'Unknown',
+        'confidence': 0.0,
+        'quality_score': 0.0
+    })
+
+    # Posición del rostro dentro de su frame (1, 2, ...)
+    rostros_por_frame = [len(frame['emociones']) for frame in frames]
+    grupos = np.repeat(np.arange(len(frames)), rostros_por_frame)
+    df.insert(2, 'rostro', df.groupby(grupos).cumcount() + 1)
+
+    return df
+
+def _run_id(results: Dict) -> Optional[str]:
+    """Identificador del análisis (clave de cache de sus tablas derivadas), o None si falta."""
+    return results.get('session_info', {}).get('run_id') or None
+
+def _calcular_tablas(emociones: List[Dict]) -> Tuple:
+    """
+    Calcula las tablas y agregados de emociones de un análisis.
+    
+    Args:
+        emociones (List[Dict]): Resultados por frame del pipeline
+        
+    Returns:
+        Tuple: (df, conteo_emociones, confianza_promedio, total_rostros, total_frames)
+    """
+    df = _emotions_to_df(emociones)
+    conteo_emociones = df['emotion'].value_counts()
+    confianza_promedio = float(df['confidence'].mean()) if not df.empty else 0.0
+    return df, conteo_emociones, confianza_promedio, len(df), len(emociones)
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _derive_tables(run_id: str, _emociones: List[Dict]) -> Tuple:
+    """
+    Deriva una sola vez por análisis las tablas y agregados de emociones.
+    
+    `_emociones` no se hashea (prefijo `_`): la clave de cache es `run_id`,
+    asignado al terminar cada análisis, así los reruns no recorren la lista.
+    """
+    return _calcular_tablas(_emociones)
+
+def _tablas_emociones(run_id: Optional[str], emociones: List[Dict]) -> Tuple:
+    """
+    Tablas de emociones de un análisis: cacheadas por `run_id` si existe.
+    
+    Sin identificador se calculan al vuelo: el cache es compartido por todas
+    las sesiones y una clave vacía mezclaría resultados de análisis distintos.
+    """
+    if run_id is None:
+        return _calcular_tablas(emociones)
+    return _derive_tables(run_id, emociones)
+
+def display_emotions_analysis(emociones: List[Dict], run_id: Optional[str]):
     """Muestra análisis detallado de emociones."""
     if not emociones:
         st.warning("No se detectaron emociones en el video.")
@@ -456,6 +660,9 @@ def display_emotions_analysis(emociones: List[Dict]):
 
     st.markdown("### 😊 Análisis de Emociones Faciales")
 
+    # Tablas derivadas cacheadas por análisis: alimentan estadísticas y tabla detallada
+    df, conteo_emociones, promedio_confianza, total, _ = _tablas_emociones(run_id, emociones)
+
     # Crear dos columnas para el análisis
     col1, col2 = st.columns([2, 1])
 
@@ -488,23 +695,10 @@ def display_emotions_analysis(emociones: List[Dict]):
         </div>
         """, unsafe_allow_html=True)
 
-        # Calcular estadísticas
-        conteo_emociones = {}
-        confianzas = []
-
-        for frame_result in emociones:
-            for emocion_data in frame_result.get('emociones', []):
-                emocion = emocion_data.get('emotion', 'Unknown')
-                confianza = emocion_data.get('confidence', 0.0)
-
-                conteo_emociones[emocion] = conteo_emociones.get(emocion, 0) + 1
-                confianzas.append(confianza)
-
-        if conteo_emociones:
-            total = sum(conteo_emociones.values())
-            emocion_predominante = max(conteo_emociones, key=conteo_emociones.get)
+        # Estadísticas
+        if total:
+            emocion_predominante = conteo_emociones.idxmax()
             porcentaje_pred = (conteo_emociones[emocion_predominante] / total) * 100
-            promedio_confianza = sum(confianzas)/len(confianzas) if confianzas else 0.0
 
             st.metric("Emoción Predominante", emocion_predominante, f"{porcentaje_pred:.1f}%")
             st.metric("Confianza Promedio", f"{promedio_confianza:.2f}", "")
@@ -512,7 +706,7 @@ def display_emotions_analysis(emociones: List[Dict]):
 
             # Mini gráfico de distribución
             st.markdown("**Distribución:**")
-            for emocion, count in sorted(conteo_emociones.items(), key=lambda x: x[1], reverse=True)[:5]:
+            for emocion, count in conteo_emociones.nlargest(5).items():
                 percentage = (count / total) * 100
                 st.write(f"• {emocion}: {percentage:.1f}%")
 
@@ -520,24 +714,14 @@ def display_emotions_analysis(emociones: List[Dict]):
 
     # Tabla detallada de emociones
     with st.expander("📋 Ver Tabla Detallada de Emociones", expanded=False):
-        data_tabla = []
-        for frame_result in emociones:
-            frame_id = frame_result.get('frame_id', 0)
-            tiempo = frame_result.get('tiempo_video', 0)
-
-            for i, emocion_data in enumerate(frame_result.get('emociones', [])):
-                data_tabla.append({
-                    "Frame": frame_id,
-                    "Tiempo (s)": f"{tiempo:.2f}",
-                    "Rostro": i + 1,
-                    "Emoción": emocion_data.get('emotion', 'Unknown'),
-                    "Confianza": f"{emocion_data.get('confidence', 0.0):.3f}",
-                    "Calidad": f"{emocion_data.get('quality_score', 0.0):.3f}"
-                })
-
-        if data_tabla:
-            df = pd.DataFrame(data_tabla)
-            st.dataframe(df, use_container_width=True, height=300)
+        if not df.empty:
+            # Columnas numéricas: el formato se aplica al mostrar, no celda a celda en Python
+            tabla = df.rename(columns=_COLUMNAS_TABLA_EMOCIONES)
+            st.dataframe(
+                tabla.style.format(_FORMATO_TABLA_EMOCIONES),
+                use_container_width=True,
+                height=300
+            )
 
 def display_audio_analysis(audio_data: Dict):
     """Muestra análisis detallado de audio."""
@@ -547,6 +731,14 @@ def display_audio_analysis(audio_data: Dict):
 
     st.markdown("### 🎤 Análisis de Comunicación Verbal")
 
+    # Extraer una sola vez los campos usados en ambas columnas
+    transcripcion = audio_data.get('transcription', 'Sin transcripción disponible')
+    palabras_detectadas = audio_data.get('palabras_detectadas', [])
+    palabras_totales = audio_data.get('palabras_totales', 0)
+    intentos = audio_data.get('intentos_comunicacion', 0)
+    calidad = audio_data.get('calidad_comunicacion', 'No evaluado').replace('_', ' ').title()
+    palabras_infantiles = audio_data.get('palabras_infantiles', [])
+
     col1, col2 = st.columns([3, 2])
 
     with col1:
@@ -559,7 +751,6 @@ def display_audio_analysis(audio_data: Dict):
         """, unsafe_allow_html=True)
 
         # Transcripción
-        transcripcion = audio_data.get('transcription', 'Sin transcripción disponible')
         if transcripcion:
             st.markdown("**Transcripción completa:**")
             st.info(f'"{transcripcion}"')
@@ -567,12 +758,12 @@ def display_audio_analysis(audio_data: Dict):
             st.warning("No se detectó comunicación verbal clara")
 
         # Palabras detectadas
-        palabras_detectadas = audio_data.get('palabras_detectadas', [])
         if palabras_detectadas:
             st.markdown("**Palabras identificadas:**")
             st.write(" • ".join(palabras_detectadas[:15]))  # Mostrar primeras 15
-            if len(palabras_detectadas) > 15:
-                st.write(f"... y {len(palabras_detectadas) - 15} más")
+            restantes = len(palabras_detectadas) - 15
+            if restantes > 0:
+                st.write(f"... y {restantes} más")
 
         st.markdown('</div>', unsafe_allow_html=True)
 
@@ -586,22 +777,43 @@ def display_audio_analysis(audio_data: Dict):
         """, unsafe_allow_html=True)
 
         # Métricas
-        palabras_totales = audio_data.get('palabras_totales', 0)
-        intentos = audio_data.get('intentos_comunicacion', 0)
-        calidad = audio_data.get('calidad_comunicacion', 'No evaluado').replace('_', ' ').title()
-
         st.metric("Palabras Totales", palabras_totales)
         st.metric("Intentos Comunicativos", intentos)
         st.metric("Calidad Comunicativa", calidad)
 
         # Palabras infantiles
-        palabras_infantiles = audio_data.get('palabras_infantiles', [])
         if palabras_infantiles:
             st.markdown("**Vocabulario infantil:**")
             st.write(f"{len(palabras_infantiles)} palabras apropiadas")
 
         st.markdown('</div>', unsafe_allow_html=True)
 
+# Palabras que marcan una recomendación como prioritaria, de la más a la menos
+# frecuente en los textos del backend para que any() corte cuanto antes
+_PALABRAS_URGENTES = ('urgente', '🚨', 'inmediato', 'crítico')
+
+# Palabras clave (coincidencia por subcadena) de cada pestaña de recomendaciones
+_PALABRAS_CATEGORIA = {
+    'emocionales': frozenset({'emocional', '😢', '😤', '😊', 'regulación'}),
+    'comunicativas': frozenset({'comunicación', '🗣️', 'verbal', 'lenguaje'}),
+    'familiares': frozenset({'familia', '👨‍👩‍👧', 'cuidadores', 'hogar'})
+}
+
+@lru_cache(maxsize=1024)
+def _classify_rec(rec: str) -> Tuple[str, ...]:
+    """
+    Devuelve las pestañas a las que pertenece una recomendación.
+    
+    Memoizado por texto: las mismas recomendaciones se repiten entre reruns
+    y análisis, así cada cadena se clasifica una sola vez. Una recomendación
+    puede pertenecer a varias categorías (o a ninguna).
+    """
+    rec_lower = rec.lower()
+    return tuple(
+        categoria for categoria, palabras in _PALABRAS_CATEGORIA.items()
+        if any(palabra in rec_lower for palabra in palabras)
+    )
+
 def display_recommendations(recomendaciones: List[str], session_info: Dict):
     """Muestra recomendaciones personalizadas."""
     if not recomendaciones:
@@ -615,10 +827,10 @@ def display_recommendations(recomendaciones: List[str], session_info: Dict):
     recomendaciones_generales = []
 
     for rec in recomendaciones:
-        if any(palabra in rec.lower() for palabra in ['urgente', '🚨', 'inmediato', 'crítico']):
-            recomendaciones_urgentes.append(rec)
-        else:
-            recomendaciones_generales.append(rec)
+        rec_lower = rec.lower()
+        (recomendaciones_urgentes
+         if any(palabra in rec_lower for palabra in _PALABRAS_URGENTES)
+         else recomendaciones_generales).append(rec)
 
     # Mostrar recomendaciones urgentes
     if recomendaciones_urgentes:
@@ -634,28 +846,54 @@ def display_recommendations(recomendaciones: List[str], session_info: Dict):
     if recomendaciones_generales:
         st.markdown("#### 📋 Recomendaciones Generales")
 
+        # Clasificación por pestaña en una sola pasada (memoizada por texto)
+        categorias = {categoria: [] for categoria in _PALABRAS_CATEGORIA}
+        for rec in recomendaciones_generales:
+            for categoria in _classify_rec(rec):
+                categorias[categoria].append(rec)
+
         # Crear tabs para organizar recomendaciones
         tabs = st.tabs(["🎯 Emocionales", "🗣️ Comunicativas", "🏠 Familiares", "📚 Todas"])
 
         with tabs[0]:  # Emocionales
-            emocionales = [r for r in recomendaciones_generales if any(word in r.lower() for word in ['emocional', '😢', '😤', '😊', 'regulación'])]
-            for i, rec in enumerate(emocionales, 1):
+            for i, rec in enumerate(categorias['emocionales'], 1):
                 st.markdown(f"**{i}.** {rec}")
 
         with tabs[1]:  # Comunicativas
-            comunicativas = [r for r in recomendaciones_generales if any(word in r.lower() for word in ['comunicación', '🗣️', 'verbal', 'lenguaje'])]
-            for i, rec in enumerate(comunicativas, 1):
+            for i, rec in enumerate(categorias['comunicativas'], 1):
                 st.markdown(f"**{i}.** {rec}")
 
         with tabs[2]:  # Familiares
-            familiares = [r for r in recomendaciones_generales if any(word in r.lower() for word in ['familia', '👨‍👩‍👧', 'cuidadores', 'hogar'])]
-            for i, rec in enumerate(familiares, 1):
+            for i, rec in enumerate(categorias['familiares'], 1):
                 st.markdown(f"**{i}.** {rec}")
 
         with tabs[3]:  # Todas
             for i, rec in enumerate(recomendaciones_generales, 1):
                 st.markdown(f"**{i}.** {rec}")
 
+def _mtime(path: str) -> Optional[float]:
+    """Fecha de modificación del archivo, o None si no existe (un solo stat)."""
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _read_bytes(path: str, mtime: float) -> bytes:
+    """
+    Lee un archivo completo para los botones de descarga.
+    
+    La clave incluye `mtime`, así el cache se invalida si el archivo se regenera.
+    """
+    with open(path, 'rb') as f:
+        return f.read()
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _read_text_head(path: str, mtime: float, max_bytes: int) -> str:
+    """Lee los primeros `max_bytes` de un archivo de texto UTF-8 (vista previa)."""
+    with open(path, 'rb') as f:
+        return f.read(max_bytes).decode('utf-8', errors='ignore')
+
 def display_reports_section(results: Dict):
     """Muestra sección de reportes y descargas."""
     if not results:
@@ -672,15 +910,14 @@ def display_reports_section(results: Dict):
         st.markdown('<div class="professional-card">', unsafe_allow_html=True)
         st.markdown("#### 📊 Dashboard Visual")
         if archivos.get('dashboard'):
-            if os.path.exists(archivos['dashboard']):
-                # Se asume que datetime, os, y open están disponibles
-                with open(archivos['dashboard'], 'rb') as file:
-                    st.download_button(
-                        label="⬇️ Descargar Dashboard",
-                        data=file.read(),
-                        file_name=f"dashboard_{datetime.now().strftime('%Y%m%d_%H%M')}.png",
-                        mime="image/png"
-                    )
+            mtime = _mtime(archivos['dashboard'])
+            if mtime is not None:
+                st.download_button(
+                    label="⬇️ Descargar Dashboard",
+                    data=_read_bytes(archivos['dashboard'], mtime),
+                    file_name=f"dashboard_{datetime.now().strftime('%Y%m%d_%H%M')}.png",
+                    mime="image/png"
+                )
                 st.success("Dashboard generado")
             else:
                 st.info("Archivo de Dashboard no encontrado")
@@ -692,14 +929,14 @@ def display_reports_section(results: Dict):
         st.markdown('<div class="professional-card">', unsafe_allow_html=True)
         st.markdown("#### 📈 Timeline Emocional")
         if archivos.get('timeline'):
-            if os.path.exists(archivos['timeline']):
-                with open(archivos['timeline'], 'rb') as file:
-                    st.download_button(
-                        label="⬇️ Descargar Timeline",
-                        data=file.read(),
-                        file_name=f"timeline_{datetime.now().strftime('%Y%m%d_%H%M')}.png",
-                        mime="image/png"
-                    )
+            mtime = _mtime(archivos['timeline'])
+            if mtime is not None:
+                st.download_button(
+                    label="⬇️ Descargar Timeline",
+                    data=_read_bytes(archivos['timeline'], mtime),
+                    file_name=f"timeline_{datetime.now().strftime('%Y%m%d_%H%M')}.png",
+                    mime="image/png"
+                )
                 st.success("Timeline generado")
             else:
                 st.info("Archivo de Timeline no encontrado")
@@ -711,14 +948,14 @@ def display_reports_section(results: Dict):
         st.markdown('<div class="professional-card">', unsafe_allow_html=True)
         st.markdown("#### 📋 Datos Exportados")
         if archivos.get('csv'):
-            if os.path.exists(archivos['csv']):
-                with open(archivos['csv'], 'rb') as file:
-                    st.download_button(
-                        label="⬇️ Descargar CSV",
-                        data=file.read(),
-                        file_name=f"datos_analisis_{datetime.now().strftime('%Y%m%d_%H%M')}.csv",
-                        mime="text/csv"
-                    )
+            mtime = _mtime(archivos['csv'])
+            if mtime is not None:
+                st.download_button(
+                    label="⬇️ Descargar CSV",
+                    data=_read_bytes(archivos['csv'], mtime),
+                    file_name=f"datos_analisis_{datetime.now().strftime('%Y%m%d_%H%M')}.csv",
+                    mime="text/csv"
+                )
                 st.success("Datos CSV generados")
             else:
                 st.info("Archivo CSV no encontrado")
@@ -730,22 +967,195 @@ def display_reports_section(results: Dict):
     st.markdown("#### 📑 Reporte Completo")
     if results.get('reporte'):
         try:
-            with open(results['reporte'], 'r', encoding='utf-8') as f:
-                reporte_contenido = f.read()
+            mtime = os.path.getmtime(results['reporte'])
+            # Solo una vista previa viaja al navegador; el reporte completo va en la descarga
+            reporte_preview = _read_text_head(results['reporte'], mtime, REPORT_PREVIEW_BYTES)
 
             col1, col2 = st.columns([3, 1])
             with col1:
-                st.text_area("Reporte Completo", reporte_contenido, height=300)
+                st.text_area(
+                    f"Vista previa del reporte (primeros {REPORT_PREVIEW_BYTES // 1024} KB)",
+                    reporte_preview,
+                    height=300
+                )
             with col2:
                 st.download_button(
                     label="📄 Descargar Reporte TXT",
-                    data=reporte_contenido,
+                    data=_read_bytes(results['reporte'], mtime),
                     file_name=f"reporte_completo_{datetime.now().strftime('%Y%m%d_%H%M')}.txt",
                     mime="text/plain"
                 )
         except Exception as e:
             st.error(f"Error cargando reporte: {e}")
 
+# Contenido estático de la pantalla de ayuda (se construye una vez al importar).
+# Cada pieza es HTML sin líneas en blanco para poder agruparlas en filas flex.
+_AYUDA_HTML = {
+    'card1': """<div class="professional-card">
+    <div class="card-header">
+        <span class="card-icon">📹</span>
+        <h3 class="card-title">1. Sube tu Video</h3>
+    </div>
+    <p>Selecciona un video del niño en formato MP4, AVI, MOV o MKV.
+    Asegúrate de que tenga buena iluminación y el rostro sea visible.</p>
+</div>""",
+    'card2': """<div class="professional-card">
+    <div class="card-header">
+        <span class="card-icon">📝</span>
+        <h3 class="card-title">2. Completa la Información</h3>
+    </div>
+    <p>Proporciona datos del niño como edad, diagnóstico y contexto.
+    Esta información ayuda a generar recomendaciones más precisas.</p>
+</div>""",
+    'card3': """<div class="professional-card">
+    <div class="card-header">
+        <span class="card-icon">🚀</span>
+        <h3 class="card-title">3. Ejecuta el Análisis</h3>
+    </div>
+    <p>Haz clic en "Ejecutar Análisis" y espera mientras el sistema
+    procesa el video y genera recomendaciones personalizadas.</p>
+</div>""",
+    'features_left': """<div>
+    <strong>🧠 Análisis Emocional Avanzado:</strong>
+    <ul>
+        <li>Detección de 7 emociones básicas</li>
+        <li>Análisis temporal y de patrones</li>
+        <li>Sistema ensemble de múltiples modelos</li>
+        <li>Evaluación de calidad de detección</li>
+    </ul>
+    <strong>🎤 Análisis de Comunicación:</strong>
+    <ul>
+        <li>Transcripción automática de audio</li>
+        <li>Detección de palabras y vocabulario</li>
+        <li>Evaluación de calidad comunicativa</li>
+        <li>Análisis por segmentos temporales</li>
+    </ul>
+</div>""",
+    'features_right': """<div>
+    <strong>💡 Recomendaciones Personalizadas:</strong>
+    <ul>
+        <li>Específicas por diagnóstico</li>
+        <li>Basadas en patrones detectados</li>
+        <li>Integración emoción-comunicación</li>
+        <li>Niveles de prioridad</li>
+    </ul>
+    <strong>📊 Reportes Completos:</strong>
+    <ul>
+        <li>Dashboard visual interactivo</li>
+        <li>Timeline emocional detallado</li>
+        <li>Exportación en múltiples formatos</li>
+        <li>Análisis estadístico completo</li>
+    </ul>
+</div>""",
+    'tips_left': """<div class="info-panel">
+    <strong>📹 Calidad del Video:</strong>
+    <ul>
+        <li>Iluminación clara y uniforme</li>
+        <li>Rostro del niño visible en la mayoría de frames</li>
+        <li>Evitar movimientos bruscos de cámara</li>
+        <li>Duración recomendada: 30 segundos - 5 minutos</li>
+    </ul>
+</div>""",
+    'tips_right': """<div class="info-panel">
+    <strong>🔊 Calidad del Audio:</strong>
+    <ul>
+        <li>Minimizar ruido de fondo</li>
+        <li>Volumen apropiado (ni muy bajo ni saturado)</li>
+        <li>Habla clara del niño</li>
+        <li>Evitar múltiples voces simultáneas</li>
+    </ul>
+</div>"""
+}
+
+_CARD_ROW_TMPL = '<div class="card-row">{contenido}</div>'
+
+# Pantalla de ayuda completa en un único payload: títulos y filas flex separados
+# por líneas en blanco (cada fila es un bloque HTML independiente)
+_AYUDA_PANTALLA = "\n\n".join((
+    "### 🎯 Cómo usar el sistema",
+    _CARD_ROW_TMPL.format(contenido="".join(
+        _AYUDA_HTML[clave] for clave in ('card1', 'card2', 'card3'))),
+    "### 📚 Características del Sistema",
+    _CARD_ROW_TMPL.format(contenido="".join(
+        _AYUDA_HTML[clave] for clave in ('features_left', 'features_right'))),
+    "### 💡 Consejos para Mejores Resultados",
+    _CARD_ROW_TMPL.format(contenido="".join(
+        _AYUDA_HTML[clave] for clave in ('tips_left', 'tips_right')))
+))
+
+# Etiquetas de las pestañas principales de resultados
+_MAIN_TAB_LABELS = (
+    "😊 Análisis Emocional",
+    "🎤 Análisis de Audio",
+    "💡 Recomendaciones",
+    "📊 Reportes",
+    "ℹ️ Información Técnica"
+)
+
+# Pestañas de resultados como fragmentos. Leen los resultados desde
+# session_state (no por argumento) para ver siempre el último análisis
+# también en las re-ejecuciones parciales del fragmento.
+
+@st.fragment
+def _tab_emotions():
+    """Pestaña de análisis emocional."""
+    results = st.session_state.analysis_results
+    display_emotions_analysis(results.get('emociones', []), _run_id(results))
+
+@st.fragment
+def _tab_audio():
+    """Pestaña de análisis de audio."""
+    display_audio_analysis(st.session_state.analysis_results.get('audio', {}))
+
+@st.fragment
+def _tab_recs():
+    """Pestaña de recomendaciones."""
+    results = st.session_state.analysis_results
+    display_recommendations(
+        results.get('recomendaciones', []),
+        results.get('session_info', {})
+    )
+
+@st.fragment
+def _tab_reports():
+    """Pestaña de reportes y descargas."""
+    display_reports_section(st.session_state.analysis_results)
+
+@lru_cache(maxsize=256)
+def _pretty(etapa: str) -> str:
+    """Nombre legible de una etapa del pipeline (memoizado: se repiten entre reruns)."""
+    return etapa.replace('_', ' ').title()
+
+@st.fragment
+def _tab_tech():
+    """Pestaña de información técnica de la sesión."""
+    st.markdown("### ⚙️ Información Técnica de la Sesión")
+    session_info = st.session_state.analysis_results.get('session_info', {})
+    errores = session_info.get('errores', [])
+    etapas = session_info.get('etapas_completadas', [])
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.json({
+            "ID de Sesión": session_info.get('session_id', 'N/A'),
+            "Tiempo de Procesamiento": session_info.get('tiempo_procesamiento', 'N/A'),
+            "Etapas Completadas": len(etapas),
+            "Errores Encontrados": len(errores)
+        })
+
+    with col2:
+        if errores:
+            st.markdown("**Errores durante el procesamiento:**")
+            st.error("\n\n".join(str(error) for error in errores))
+        else:
+            st.success("✅ No se encontraron errores durante el procesamiento")
+
+        # Un solo elemento para todas las etapas (salto de línea forzado de markdown)
+        st.markdown("  \n".join(
+            ["**Etapas completadas:**"] +
+            [f"• {_pretty(etapa)}" for etapa in etapas]
+        ))
+
 def main():
     """Función principal de la aplicación."""
     # Cargar CSS personalizado
@@ -763,20 +1173,42 @@ def main():
     # Botón de análisis
     if st.sidebar.button("🚀 Ejecutar Análisis Completo", key="analyze_btn", type="primary"):
         if video_file is not None:
-            st.session_state.processing = True
-            st.session_state.analysis_results = None
+            # Tamaño, extensión y firma del contenedor antes de copiar el video
+            valido, mensaje = validar_video(video_file)
+            if valido:
+                st.session_state.processing = True
+                st.session_state.analysis_results = None
+            else:
+                st.sidebar.error(f"⚠️ {mensaje}")
         else:
             st.sidebar.error("⚠️ Por favor, sube un video antes de continuar")
 
     # Procesar análisis si está activado
     if st.session_state.processing and video_file is not None:
-        # Crear directorio temporal
-        os.makedirs("./temp_uploaded_videos", exist_ok=True)
-        temp_path = f"./temp_uploaded_videos/{video_file.name}"
-
-        # Guardar archivo temporal
-        with open(temp_path, "wb") as f:
-            f.write(video_file.getbuffer())
+        # Crear directorio temporal (y descartar restos de un análisis interrumpido)
+        os.makedirs(TEMP_UPLOAD_DIR, exist_ok=True)
+        _limpiar_video_temporal()
+
+        # Guardar archivo temporal con nombre único por bloques (memoria acotada
+        # aunque el video sea grande y sin colisiones entre sesiones concurrentes).
+        # En la misma pasada se calcula la huella del contenido: clave de cache
+        # de resultados para videos idénticos
+        video_file.seek(0)
+        huella = hashlib.sha256()
+        with tempfile.NamedTemporaryFile(
+            suffix=os.path.splitext(video_file.name)[1],
+            dir=TEMP_UPLOAD_DIR,
+            delete=False
+        ) as f:
+            while True:
+                bloque = video_file.read(UPLOAD_CHUNK_BYTES)
+                if not bloque:
+                    break
+                huella.update(bloque)
+                f.write(bloque)
+            temp_path = f.name
+        st.session_state.temp_video_path = temp_path
+        digest = huella.hexdigest()
 
         # Mostrar progreso
         progress_container = st.container()
@@ -786,35 +1218,45 @@ def main():
             status_text = st.empty()
 
             try:
-                # Inicializar pipeline
+                # Inicializar pipeline: uno por sesión, porque el detector guarda
+                # sus directorios de salida y métricas de la sesión
                 if st.session_state.pipeline is None:
                     status_text.text("Inicializando sistema...")
                     progress_bar.progress(10)
-                    # Se asume que PipelineAnalisisEmocional está disponible
                     st.session_state.pipeline = PipelineAnalisisEmocional(models_dir=models_dir)
 
-                # Ejecutar análisis
+                # Ejecutar análisis (se reutiliza el resultado si el video y los
+                # parámetros ya se analizaron antes)
                 status_text.text("Analizando video y audio...")
                 progress_bar.progress(50)
 
-                # Se asume que el método ejecutar_pipeline es accesible
-                resultados = st.session_state.pipeline.ejecutar_pipeline(
-                    video_path=temp_path,
-                    lang=language,
-                    datos_personales=datos_personales,
-                    configuracion_personalizada=configuracion
+                inicio = datetime.now()
+                resultados = _run_pipeline(
+                    digest, models_dir, language, datos_personales, configuracion, temp_path,
+                    st.session_state.pipeline
                 )
 
                 progress_bar.progress(100)
                 status_text.text("✅ Análisis completado exitosamente!")
 
+                # Resultado servido desde el cache: avisar que no es un análisis nuevo
+                if resultados.get('generado_en', inicio) < inicio:
+                    session_id = resultados.get('session_info', {}).get('session_id', 'N/A')
+                    st.info(
+                        f"♻️ Este video ya se analizó con los mismos parámetros: se muestran "
+                        f"los resultados de la sesión {session_id}."
+                    )
+
+                # Identificador único del análisis (clave de cache de las tablas derivadas)
+                if 'session_info' in resultados:
+                    resultados['session_info']['run_id'] = uuid.uuid4().hex
+
                 # Guardar resultados
                 st.session_state.analysis_results = resultados
                 st.session_state.processing = False
 
                 # Limpiar archivo temporal
-                if os.path.exists(temp_path):
-                    os.remove(temp_path)
+                _limpiar_video_temporal()
 
                 st.balloons()
                 st.success("🎉 ¡Análisis completado con éxito!")
@@ -824,168 +1266,45 @@ def main():
                 st.session_state.processing = False
 
                 # Limpiar archivo temporal en caso de error
-                if os.path.exists(temp_path):
-                    os.remove(temp_path)
+                _limpiar_video_temporal()
 
     # Mostrar resultados si están disponibles
     if st.session_state.analysis_results:
         results = st.session_state.analysis_results
+        session_info = results.get('session_info', {})
 
-        # Dashboard de métricas
-        display_metrics_dashboard(results)
-
-        # Mostrar alertas
-        if results.get('session_info', {}).get('alertas'):
-            display_alerts(results.get('session_info', {}))
-
-        # Crear tabs principales
-        tab1, tab2, tab3, tab4, tab5 = st.tabs([
-            "😊 Análisis Emocional",
-            "🎤 Análisis de Audio",
-            "💡 Recomendaciones",
-            "📊 Reportes",
-            "ℹ️ Información Técnica"
-        ])
+        # Contenedor con clave estable por análisis: la vista de resultados
+        # conserva su identidad entre reruns mientras no cambie el análisis
+        with st.container(key=f"results_{_run_id(results) or 'actual'}"):
+            # Dashboard de métricas
+            display_metrics_dashboard(results)
 
-        with tab1:
-            display_emotions_analysis(results.get('emociones', []))
+            # Mostrar alertas
+            if session_info.get('alertas'):
+                display_alerts(session_info)
 
-        with tab2:
-            display_audio_analysis(results.get('audio', {}))
-
-        with tab3:
-            display_recommendations(
-                results.get('recomendaciones', []),
-                results.get('session_info', {})
-            )
+            # Crear tabs principales
+            tab1, tab2, tab3, tab4, tab5 = st.tabs(_MAIN_TAB_LABELS)
 
-        with tab4:
-            display_reports_section(results)
+            # Cada pestaña es un fragmento: interactuar dentro de una sólo re-ejecuta esa pestaña
+            with tab1:
+                _tab_emotions()
 
-        with tab5:
-            st.markdown("### ⚙️ Información Técnica de la Sesión")
-            session_info = results.get('session_info', {})
+            with tab2:
+                _tab_audio()
 
-            col1, col2 = st.columns(2)
-            with col1:
-                st.json({
-                    "ID de Sesión": session_info.get('session_id', 'N/A'),
-                    "Tiempo de Procesamiento": session_info.get('tiempo_procesamiento', 'N/A'),
-                    "Etapas Completadas": len(session_info.get('etapas_completadas', [])),
-                    "Errores Encontrados": len(session_info.get('errores', []))
-                })
+            with tab3:
+                _tab_recs()
 
-            with col2:
-                if session_info.get('errores'):
-                    st.markdown("**Errores durante el procesamiento:**")
-                    for error in session_info['errores']:
-                        st.error(error)
-                else:
-                    st.success("✅ No se encontraron errores durante el procesamiento")
+            with tab4:
+                _tab_reports()
 
-                st.markdown("**Etapas completadas:**")
-                for etapa in session_info.get('etapas_completadas', []):
-                    st.write(f"• {etapa.replace('_', ' ').title()}")
+            with tab5:
+                _tab_tech()
 
     # Mostrar información de ayuda si no hay resultados
     elif not st.session_state.processing:
-        st.markdown("### 🎯 Cómo usar el sistema")
-
-        col1, col2, col3 = st.columns(3)
-
-        with col1:
-            st.markdown("""
-            <div class="professional-card">
-                <div class="card-header">
-                    <span class="card-icon">📹</span>
-                    <h3 class="card-title">1. Sube tu Video</h3>
-                </div>
-                <p>Selecciona un video del niño en formato MP4, AVI, MOV o MKV.
-                Asegúrate de que tenga buena iluminación y el rostro sea visible.</p>
-            </div>
-            """, unsafe_allow_html=True)
-
-        with col2:
-            st.markdown("""
-            <div class="professional-card">
-                <div class="card-header">
-                    <span class="card-icon">📝</span>
-                    <h3 class="card-title">2. Completa la Información</h3>
-                </div>
-                <p>Proporciona datos del niño como edad, diagnóstico y contexto.
-                Esta información ayuda a generar recomendaciones más precisas.</p>
-            </div>
-            """, unsafe_allow_html=True)
-
-        with col3:
-            st.markdown("""
-            <div class="professional-card">
-                <div class="card-header">
-                    <span class="card-icon">🚀</span>
-                    <h3 class="card-title">3. Ejecuta el Análisis</h3>
-                </div>
-                <p>Haz clic en "Ejecutar Análisis" y espera mientras el sistema
-                procesa el video y genera recomendaciones personalizadas.</p>
-            </div>
-            """, unsafe_allow_html=True)
-
-        # Información adicional
-        st.markdown("### 📚 Características del Sistema")
-
-        features_col1, features_col2 = st.columns(2)
-
-        with features_col1:
-            st.markdown("""
-            **🧠 Análisis Emocional Avanzado:**
-            - Detección de 7 emociones básicas
-            - Análisis temporal y de patrones
-            - Sistema ensemble de múltiples modelos
-            - Evaluación de calidad de detección
-
-            **🎤 Análisis de Comunicación:**
-            - Transcripción automática de audio
-            - Detección de palabras y vocabulario
-            - Evaluación de calidad comunicativa
-            - Análisis por segmentos temporales
-            """)
-
-        with features_col2:
-            st.markdown("""
-            **💡 Recomendaciones Personalizadas:**
-            - Específicas por diagnóstico
-            - Basadas en patrones detectados
-            - Integración emoción-comunicación
-            - Niveles de prioridad
-
-            **📊 Reportes Completos:**
-            - Dashboard visual interactivo
-            - Timeline emocional detallado
-            - Exportación en múltiples formatos
-            - Análisis estadístico completo
-            """)
-
-        # Consejos para mejores resultados
-        st.markdown("### 💡 Consejos para Mejores Resultados")
-
-        tips_col1, tips_col2 = st.columns(2)
-
-        with tips_col1:
-            st.info("""
-            **📹 Calidad del Video:**
-            - Iluminación clara y uniforme
-            - Rostro del niño visible en la mayoría de frames
-            - Evitar movimientos bruscos de cámara
-            - Duración recomendada: 30 segundos - 5 minutos
-            """)
-
-        with tips_col2:
-            st.info("""
-            **🔊 Calidad del Audio:**
-            - Minimizar ruido de fondo
-            - Volumen apropiado (ni muy bajo ni saturado)
-            - Habla clara del niño
-            - Evitar múltiples voces simultáneas
-            """)
+        st.markdown(_AYUDA_PANTALLA, unsafe_allow_html=True)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,9 +1,11 @@
 # main.py
 
-from frontend.interface import main_interface
-from utils.logger import log_error
-
 def iniciar_aplicacion():
+    # Importaciones diferidas: `import main` no arrastra el frontend ni el
+    # backend (TensorFlow, OpenCV); sólo se cargan al iniciar la aplicación
+    from frontend.interface import main_interface
+    from utils.logger import log_error
+
     try:
         # Ejecuta la interfaz Streamlit principal
         main_interface()
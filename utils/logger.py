@@ -8,6 +8,7 @@ Proporciona funciones de logging centralizadas para todo el sistema.
 import logging
 import os
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 
 # Configuración global de logging
@@ -26,6 +27,16 @@ def setup_logger(name: str, log_file: Optional[str] = None, level: int = LOG_LEV
     Returns:
         logging.Logger: Logger configurado
     """
+    return _get_logger(name, log_file, level)
+
+@lru_cache(maxsize=64)
+def _get_logger(name: str, log_file: Optional[str], level: int) -> logging.Logger:
+    """
+    Implementación memoizada de setup_logger.
+    
+    log_error/log_info/log_warning la invocan en cada mensaje: tras la
+    primera configuración cada llamada es una sola búsqueda en el cache.
+    """
     logger = logging.getLogger(name)
     
     # Evitar duplicar handlers
@@ -1,13 +1,55 @@
 import os
 
-def validar_video(video_file, max_size_bytes=200*1024*1024, valid_extensions=None):
-    if valid_extensions is None:
-        valid_extensions = [".mp4", ".avi", ".mov", ".mkv"]
-    nombre = video_file.name.lower()
-    if not any(nombre.endswith(ext) for ext in valid_extensions):
-        return False, f"Formato no soportado. Use {', '.join(valid_extensions)}"
+# Extensiones de video aceptadas (búsqueda O(1)) y su texto para el mensaje de error
+_VALID_EXTS = frozenset((".mp4", ".avi", ".mov", ".mkv"))
+_VALID_EXTS_MSG = ".mp4, .avi, .mov, .mkv"
+
+# Tamaño máximo por defecto
+MAX_VIDEO_BYTES = 200*1024*1024
+
+# Contenedor que debe tener el contenido de cada extensión con firma reconocible
+_CONTENEDOR_POR_EXT = {
+    ".mp4": "mp4/mov",
+    ".mov": "mp4/mov",
+    ".m4v": "mp4/mov",
+    ".avi": "avi",
+    ".mkv": "mkv",
+    ".webm": "mkv",
+}
+
+# Tipos del primer átomo de un MP4/QuickTime (los MOV antiguos no empiezan por ftyp)
+_ATOMOS_MP4 = frozenset((b"ftyp", b"moov", b"mdat", b"wide", b"free", b"skip", b"pnot"))
+
+def _contenedor_video(cabecera):
+    """Identifica el contenedor por su firma (magic number); None si no se reconoce."""
+    if cabecera[4:8] in _ATOMOS_MP4:
+        return "mp4/mov"
+    if cabecera[:4] == b"RIFF" and cabecera[8:12] == b"AVI ":
+        return "avi"
+    if cabecera[:4] == b"\x1aE\xdf\xa3":
+        return "mkv"
+    return None
+
+def validar_video(video_file, max_size_bytes=MAX_VIDEO_BYTES, valid_extensions=None):
+    # Primero el tamaño: una comparación entera y el rechazo más habitual
     size = getattr(video_file, "size", None)
     if size is not None and size > max_size_bytes:
-        return False, f"Archivo demasiado grande. Max {max_size_bytes/(1024*1024)} MB"
+        return False, f"Archivo demasiado grande. Max {max_size_bytes / 2**20:g} MB"
+    if valid_extensions is None:
+        extensiones, extensiones_msg = _VALID_EXTS, _VALID_EXTS_MSG
+    else:
+        extensiones = frozenset(ext.lower() for ext in valid_extensions)
+        extensiones_msg = ', '.join(valid_extensions)
+    ext = os.path.splitext(video_file.name)[1].lower()
+    if ext not in extensiones:
+        return False, f"Formato no soportado. Use {extensiones_msg}"
+    # Firma del contenedor (12 bytes desde el inicio): si la extensión es de un
+    # contenedor conocido, el contenido debe ser de ese mismo contenedor
+    esperado = _CONTENEDOR_POR_EXT.get(ext)
+    if esperado is not None and hasattr(video_file, "read"):
+        video_file.seek(0)
+        cabecera = video_file.read(12)
+        video_file.seek(0)
+        if _contenedor_video(cabecera) != esperado:
+            return False, f"El contenido del archivo no corresponde a un video {ext}"
     return True, "Archivo válido"
-
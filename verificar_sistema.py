@@ -13,7 +13,70 @@ Uso:
 
 import sys
 import os
+import importlib.util
 import traceback
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
+
+# Componentes del backend verificados: (clase, módulo)
+_COMPONENTES_BACKEND: Tuple[Tuple[str, str], ...] = (
+    ('DetectorEmociones', 'backend.detector_emociones'),
+    ('AudioAnalyzer', 'backend.analizador_audio'),
+    ('GeneradorInformes', 'backend.generador_informes'),
+    ('EmotionEnsemble', 'backend.emotion_ensemble'),
+    ('ApiRecomendaciones', 'backend.api_recomendaciones'),
+    ('PipelineAnalisisEmocional', 'backend.pipeline'),
+)
+
+def _importar_clase(componente: Tuple[str, str]):
+    """
+    Importa la clase de un componente del backend.
+    
+    Args:
+        componente (Tuple[str, str]): (nombre de la clase, módulo)
+        
+    Returns:
+        La clase importada
+    """
+    nombre, modulo = componente
+    mod = __import__(modulo, fromlist=[nombre])
+    return getattr(mod, nombre)
+
+def _probar_importacion(componente: Tuple[str, str]) -> Tuple[Optional[Exception], str]:
+    """
+    Importa un componente capturando el error (se ejecuta en un hilo).
+    
+    Returns:
+        Tuple[Optional[Exception], str]: (error o None, traceback formateado)
+    """
+    try:
+        _importar_clase(componente)
+        return None, ""
+    except Exception as e:
+        return e, traceback.format_exc()
+
+def _probar_logger(componente: Tuple[str, str]) -> Tuple[Optional[bool], Optional[Exception], str]:
+    """
+    Instancia un componente y comprueba que tenga logger.
+    
+    Returns:
+        Tuple: (tiene logger o None si falló, error o None, traceback formateado)
+    """
+    try:
+        instancia = _importar_clase(componente)()
+        return hasattr(instancia, 'logger'), None, ""
+    except Exception as e:
+        return None, e, traceback.format_exc()
+
+def _en_paralelo(funcion, componentes):
+    """
+    Aplica `funcion` a cada componente en hilos y devuelve los resultados en orden.
+    
+    Sólo para importaciones: pasan mucho tiempo en E/S y código C que libera
+    el GIL, así que el tiempo total se acerca al de la más lenta.
+    """
+    with ThreadPoolExecutor(max_workers=len(componentes)) as executor:
+        return list(executor.map(funcion, componentes))
 
 def test_logger_imports():
     """Prueba las importaciones de logging."""
@@ -40,26 +103,17 @@ def test_backend_imports():
     if backend_path not in sys.path:
         sys.path.insert(0, backend_path)
     
-    componentes = {
-        'DetectorEmociones': 'backend.detector_emociones',
-        'AudioAnalyzer': 'backend.analizador_audio',
-        'GeneradorInformes': 'backend.generador_informes',
-        'EmotionEnsemble': 'backend.emotion_ensemble',
-        'ApiRecomendaciones': 'backend.api_recomendaciones',
-        'PipelineAnalisisEmocional': 'backend.pipeline',
-    }
-    
     resultados = {}
     
-    for nombre, modulo in componentes.items():
-        try:
-            mod = __import__(modulo, fromlist=[nombre])
-            clase = getattr(mod, nombre)
+    for (nombre, _), (error, detalle) in zip(
+        _COMPONENTES_BACKEND, _en_paralelo(_probar_importacion, _COMPONENTES_BACKEND)
+    ):
+        if error is None:
             print(f"✅ {nombre} importado correctamente")
             resultados[nombre] = True
-        except Exception as e:
-            print(f"❌ Error importando {nombre}: {e}")
-            traceback.print_exc()
+        else:
+            print(f"❌ Error importando {nombre}: {error}")
+            sys.stderr.write(detalle)
             resultados[nombre] = False
     
     return all(resultados.values())
@@ -77,90 +131,21 @@ def test_logger_initialization():
     
     tests = []
     
-    # Test DetectorEmociones
-    try:
-        from backend.detector_emociones import DetectorEmociones
-        detector = DetectorEmociones()
-        if hasattr(detector, 'logger'):
-            print("✅ DetectorEmociones: logger inicializado")
-            tests.append(True)
-        else:
-            print("❌ DetectorEmociones: logger NO encontrado")
-            tests.append(False)
-    except Exception as e:
-        print(f"❌ DetectorEmociones: Error - {e}")
-        tests.append(False)
-    
-    # Test AudioAnalyzer
-    try:
-        from backend.analizador_audio import AudioAnalyzer
-        analyzer = AudioAnalyzer()
-        if hasattr(analyzer, 'logger'):
-            print("✅ AudioAnalyzer: logger inicializado")
-            tests.append(True)
-        else:
-            print("❌ AudioAnalyzer: logger NO encontrado")
-            tests.append(False)
-    except Exception as e:
-        print(f"❌ AudioAnalyzer: Error - {e}")
-        tests.append(False)
-    
-    # Test GeneradorInformes
-    try:
-        from backend.generador_informes import GeneradorInformes
-        generador = GeneradorInformes()
-        if hasattr(generador, 'logger'):
-            print("✅ GeneradorInformes: logger inicializado")
-            tests.append(True)
-        else:
-            print("❌ GeneradorInformes: logger NO encontrado")
+    # Una instancia tras otra: varias construyen su propio ensemble y cargar
+    # modelos de Keras a la vez no es seguro entre hilos (y multiplica la memoria)
+    for componente in _COMPONENTES_BACKEND:
+        nombre = componente[0]
+        tiene_logger, error, detalle = _probar_logger(componente)
+        if error is not None:
+            print(f"❌ {nombre}: Error - {error}")
+            sys.stderr.write(detalle)
             tests.append(False)
-    except Exception as e:
-        print(f"❌ GeneradorInformes: Error - {e}")
-        tests.append(False)
-    
-    # Test EmotionEnsemble
-    try:
-        from backend.emotion_ensemble import EmotionEnsemble
-        ensemble = EmotionEnsemble()
-        if hasattr(ensemble, 'logger'):
-            print("✅ EmotionEnsemble: logger inicializado")
+        elif tiene_logger:
+            print(f"✅ {nombre}: logger inicializado")
             tests.append(True)
         else:
-            print("❌ EmotionEnsemble: logger NO encontrado")
+            print(f"❌ {nombre}: logger NO encontrado")
             tests.append(False)
-    except Exception as e:
-        print(f"❌ EmotionEnsemble: Error - {e}")
-        tests.append(False)
-    
-    # Test ApiRecomendaciones
-    try:
-        from backend.api_recomendaciones import ApiRecomendaciones
-        api = ApiRecomendaciones()
-        if hasattr(api, 'logger'):
-            print("✅ ApiRecomendaciones: logger inicializado")
-            tests.append(True)
-        else:
-            print("❌ ApiRecomendaciones: logger NO encontrado")
-            tests.append(False)
-    except Exception as e:
-        print(f"❌ ApiRecomendaciones: Error - {e}")
-        tests.append(False)
-    
-    # Test PipelineAnalisisEmocional
-    try:
-        from backend.pipeline import PipelineAnalisisEmocional
-        pipeline = PipelineAnalisisEmocional()
-        if hasattr(pipeline, 'logger'):
-            print("✅ PipelineAnalisisEmocional: logger inicializado")
-            tests.append(True)
-        else:
-            print("❌ PipelineAnalisisEmocional: logger NO encontrado")
-            tests.append(False)
-    except Exception as e:
-        print(f"❌ PipelineAnalisisEmocional: Error - {e}")
-        traceback.print_exc()
-        tests.append(False)
     
     return all(tests)
 
@@ -185,12 +170,13 @@ def test_dependencies():
     
     results = []
     
+    # find_spec sólo localiza el paquete: no ejecuta su código (TensorFlow
+    # tardaría segundos y cientos de MB en importarse sólo para comprobarlo)
     for module, nombre in dependencias.items():
-        try:
-            __import__(module)
+        if importlib.util.find_spec(module) is not None:
             print(f"✅ {nombre} instalado")
             results.append(True)
-        except ImportError:
+        else:
             print(f"❌ {nombre} NO instalado")
             results.append(False)
     
@@ -202,6 +188,10 @@ def test_directories():
     print("5. VERIFICANDO ESTRUCTURA DE DIRECTORIOS")
     print("="*60)
     
+    # Import diferido: frontend.init configura logging al importarse y no debe
+    # ejecutarse antes de las demás verificaciones
+    from frontend.init import listar_directorio
+    
     directorios = [
         'backend',
         'frontend',
@@ -213,8 +203,14 @@ def test_directories():
     
     results = []
     
+    # Un listado por directorio padre en lugar de un stat por entrada
+    listados = {}
+    
     for directorio in directorios:
-        if os.path.exists(directorio):
+        padre, _, nombre = directorio.rpartition('/')
+        if padre not in listados:
+            listados[padre] = listar_directorio(padre or '.')
+        if nombre in listados[padre]:
             print(f"✅ {directorio}/ existe")
             results.append(True)
         else: